@@ -14,20 +14,30 @@ class Asteroid(GameObject):
 
     def __init__(self, images, mover, health, death_spawn, score_on_die, max_angular_velocity, **kwargs):
         super().__init__(image_asset=random.choice(images), **kwargs)
+        self.images = images
         self.mover = mover
         self.health = health
+        self.initial_health = health
         self.death_spawn = death_spawn
         self.spin_delta_factor = random.choice([-1.0, 1.0])
+        self.max_angular_velocity = max_angular_velocity
         self.angular_velocity = random.randint(10, max_angular_velocity)
         self.score_on_die = score_on_die
 
+    def recycle(self, **kwargs):
+        # Same random choices in the same order as __init__
+        self.set_image(random.choice(self.images))
+        super().recycle(**kwargs)
+        self.mover.recycle()
+        self.health = self.initial_health
+        self.spin_delta_factor = random.choice([-1.0, 1.0])
+        self.angular_velocity = random.randint(10, self.max_angular_velocity)
+
     def update(self, delta):
         spin_delta = (self.angular_velocity * delta) / 1000.0 * self.spin_delta_factor
         self.heading = self.heading + spin_delta
         self.position = self.position + self.mover.move(delta)
         super().update(delta)
-        for attachment in self.attachments:
-            attachment.game_object.position = self.position
 
     def handle_collision(self, gob, world_pos):
         """Reacts to collision against game object gob."""
@@ -43,17 +53,23 @@ class Asteroid(GameObject):
         """Die. Plays an explosion if it was given an atlas for the AnimatedTexture."""
         if self.alive():
             if self.death_spawn:
+                # Spread the spawns over a 60-degree arc, creating all the spawns of the same type in one batch
                 angle = -30.0
                 angle_inc = 60.0 / len(self.death_spawn)
+                spawn_headings = {}
                 for spawn_type in self.death_spawn:
                     next_angle = angle + angle_inc
                     heading = random.uniform(angle, next_angle) % 360
                     angle = next_angle
-                    spawn = spawn_type.create(heading=heading)
-                    spawn.position = self.position
-                    direction = Transform.rotate(self.mover.direction, heading)
-                    spawn.mover.set_direction(direction)
-                    spawn.transform()
+                    spawn_headings.setdefault(spawn_type.name, (spawn_type, []))[1].append(heading)
+                for spawn_type, headings in spawn_headings.values():
+                    spawns = spawn_type.create_many(
+                        len(headings),
+                        positions=[self.position] * len(headings),
+                        headings=headings
+                    )
+                    for spawn, heading in zip(spawns, headings):
+                        spawn.mover.set_direction(Transform.rotate(self.mover.direction, heading))
         try:
             instigator.add_score(self.score_on_die)
         except AttributeError:
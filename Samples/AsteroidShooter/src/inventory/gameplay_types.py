@@ -99,7 +99,7 @@ game_types = {
             ]
         },
         "PlayerProjectile": {
-            "class_name": "Projectile",
+            "class_name": "ProjectileEntity",
             "kwargs": {
                 "image:image_asset": "player_projectile",
                 "type_spec:death_effect": "/Explosions/ExplosionSmall",
@@ -111,6 +111,9 @@ game_types = {
                 "RenderGroup",
                 "PlayerProjectilesGroup"
             ],
+            "pool": {
+                "size": 32
+            },
             "PlayerProjectileMover": {
                 "class_name": "MoverVelocity",
                 "kwargs": {
@@ -186,7 +189,10 @@ game_types = {
             },
             "groups": [
                 "RenderGroup"
-            ]
+            ],
+            "pool": {
+                "size": 16
+            }
         },
         "ExplosionSmall": {
             "class_name": "AnimatedTexture",
@@ -197,7 +203,10 @@ game_types = {
             },
             "groups": [
                 "RenderGroup"
-            ]
+            ],
+            "pool": {
+                "size": 16
+            }
         },
         "ExplosionBig": {
             "class_name": "AnimatedTexture",
@@ -208,7 +217,10 @@ game_types = {
             },
             "groups": [
                 "RenderGroup"
-            ]
+            ],
+            "pool": {
+                "size": 16
+            }
         }
     },
     "Level_02": {
@@ -271,7 +283,7 @@ game_types = {
             {
                 "game_type": "/AsteroidMother/AsteroidTurret",
                 "offset": [0, 0],
-                "parent_transform": False
+                "inherit_heading": False
             }
         ],
         "AsteroidTurret": {
@@ -306,7 +318,7 @@ game_types = {
                 ]
             },
             "AsteroidProjectile": {
-                "class_name": "Projectile",
+                "class_name": "ProjectileEntity",
                 "kwargs": {
                     "image:image_asset": "turret_projectile",
                     "type_spec:death_effect": "/Explosions/ExplosionSmall",
@@ -318,6 +330,9 @@ game_types = {
                     "RenderGroup",
                     "AsteroidProjectilesGroup"
                 ],
+                "pool": {
+                    "size": 32
+                },
                 "EnemyTurretProjectileMover": {
                     "class_name": "MoverVelocity",
                     "kwargs": {
@@ -378,6 +393,9 @@ game_types = {
             "type_spec:death_spawn": ["AsteroidSmall", "AsteroidTiny"],
             "score_on_die": 20,
             "max_angular_velocity": 80,
+        },
+        "pool": {
+            "size": 16
         }
     },
     "AsteroidSmall": {
@@ -391,6 +409,9 @@ game_types = {
             "damage": 2,
             "score_on_die": 10,
             "max_angular_velocity": 100,
+        },
+        "pool": {
+            "size": 16
         }
     },
     "AsteroidTiny": {
@@ -404,6 +425,9 @@ game_types = {
             "damage": 1,
             "score_on_die": 7,
             "max_angular_velocity": 120,
+        },
+        "pool": {
+            "size": 16
         }
     }
 }
\ No newline at end of file
@@ -41,6 +41,7 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Effects/shield1.png",
             "cache_rotations": True,
+            "symmetry": "mirror_x",
         }
     },
     "shield2": {
@@ -48,6 +49,7 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Effects/shield2.png",
             "cache_rotations": True,
+            "symmetry": "mirror_x",
         }
     },
     "shield3": {
@@ -55,6 +57,7 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Effects/shield3.png",
             "cache_rotations": True,
+            "symmetry": "mirror_x",
         }
     },
     "turret": {
@@ -62,6 +65,7 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Parts/turretBase_big.png",
             "cache_rotations": True,
+            "symmetry": "rotate_90",
         }
     },
     "turret_gun": {
@@ -77,6 +81,8 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Lasers/laserRed06.png",
             "cache_rotations": True,
+            "rotation_step": 2,
+            "symmetry": "mirror_x",
         }
     },
     "player_projectile": {
@@ -84,6 +90,8 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Lasers/laserGreen11.png",
             "cache_rotations": True,
+            "rotation_step": 2,
+            "symmetry": "mirror_x",
         }
     },
     "player_health_bar_fg": {
@@ -105,6 +113,7 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Meteors/meteorBrown_big1.png",
             "cache_rotations": True,
+            "pack_rotations": True,
         }
     },
     "asteroid_01": {
@@ -112,6 +121,7 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Meteors/meteorBrown_big2.png",
             "cache_rotations": True,
+            "pack_rotations": True,
         }
     },
     "asteroid_02": {
@@ -119,6 +129,7 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Meteors/meteorBrown_big3.png",
             "cache_rotations": True,
+            "pack_rotations": True,
         }
     },
     "asteroid_03": {
@@ -126,6 +137,7 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Meteors/meteorBrown_big4.png",
             "cache_rotations": True,
+            "pack_rotations": True,
         }
     },
     "asteroid_04": {
@@ -133,6 +145,8 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Meteors/meteorBrown_med1.png",
             "cache_rotations": True,
+            "pack_rotations": True,
+            "rotation_step": 2,
         }
     },
     "asteroid_05": {
@@ -140,6 +154,8 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Meteors/meteorBrown_med2.png",
             "cache_rotations": True,
+            "pack_rotations": True,
+            "rotation_step": 2,
         }
     },
     "asteroid_06": {
@@ -147,6 +163,8 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Meteors/meteorBrown_small1.png",
             "cache_rotations": True,
+            "pack_rotations": True,
+            "rotation_step": 4,
         }
     },
     "asteroid_07": {
@@ -154,6 +172,8 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Meteors/meteorBrown_small2.png",
             "cache_rotations": True,
+            "pack_rotations": True,
+            "rotation_step": 4,
         }
     },
     "asteroid_08": {
@@ -161,6 +181,8 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Meteors/meteorBrown_tiny1.png",
             "cache_rotations": True,
+            "pack_rotations": True,
+            "rotation_step": 4,
         }
     },
     "asteroid_09": {
@@ -168,6 +190,8 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/Meteors/meteorBrown_tiny2.png",
             "cache_rotations": True,
+            "pack_rotations": True,
+            "rotation_step": 4,
         }
     },
     "background": {
@@ -181,6 +205,7 @@ images = {
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/ufoRed.png",
             "cache_rotations": True,
+            "symmetry": "rotate_90",
         }
     },
     "arrow": {
@@ -217,70 +242,70 @@ images = {
         "class_name": "ImageAsset",
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/UI/numeral0.png",
-            "cache_rotations": True,
+            "lazy_rotations": True,
         }
     },
     "1": {
         "class_name": "ImageAsset",
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/UI/numeral1.png",
-            "cache_rotations": True,
+            "lazy_rotations": True,
         }
     },
     "2": {
         "class_name": "ImageAsset",
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/UI/numeral2.png",
-            "cache_rotations": True,
+            "lazy_rotations": True,
         }
     },
     "3": {
         "class_name": "ImageAsset",
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/UI/numeral3.png",
-            "cache_rotations": True,
+            "lazy_rotations": True,
         }
     },
     "4": {
         "class_name": "ImageAsset",
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/UI/numeral4.png",
-            "cache_rotations": True,
+            "lazy_rotations": True,
         }
     },
     "5": {
         "class_name": "ImageAsset",
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/UI/numeral5.png",
-            "cache_rotations": True,
+            "lazy_rotations": True,
         }
     },
     "6": {
         "class_name": "ImageAsset",
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/UI/numeral6.png",
-            "cache_rotations": True,
+            "lazy_rotations": True,
         }
     },
     "7": {
         "class_name": "ImageAsset",
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/UI/numeral7.png",
-            "cache_rotations": True,
+            "lazy_rotations": True,
         }
     },
     "8": {
         "class_name": "ImageAsset",
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/UI/numeral8.png",
-            "cache_rotations": True,
+            "lazy_rotations": True,
         }
     },
     "9": {
         "class_name": "ImageAsset",
         "kwargs": {
             "fname": "SpaceShooterRedux/PNG/UI/numeral9.png",
-            "cache_rotations": True,
+            "lazy_rotations": True,
         }
     },
 }
@@ -293,6 +318,13 @@ sounds = {
     "enter_sound": "SpaceShooterRedux/Bonus/sfx_shieldUp.ogg"
 }
 
+# Entries that the game code uses by name. Images, sounds and assets that none of them lead to are left out.
+roots = [
+    "game_object:/AsteroidShooterGame",
+    "image:ship_icon",
+    "asset:LayerManager",
+]
+
 fonts = {
     "fast_hand": "fast-hand-font/FastHand-lgBMV.ttf",
 }
@@ -336,7 +368,7 @@ assets = {
         "class_name": "LayerManager",
         "kwargs": {
             "layers": [
-                ["Projectile"],
+                ["Projectile", "ProjectileEntity"],
                 ["Ship"],
                 ["Shield"],
                 ["Waypoint", "/PlayerShip/Waypoint/LeftDigit", "/PlayerShip/Waypoint/RightDigit"],
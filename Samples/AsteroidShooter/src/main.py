@@ -1,14 +1,17 @@
 import asyncio
 import logging
 import os
-import time
+import sys
 
 # The following lines are required only when running directly from a terminal window. VSCode launches don't need this.
 if "PYGAME_HIDE_SUPPORT_PROMPT" not in os.environ:
-    import sys
     os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
     sys.path.append("../../../src")
 
+# Set PYGAMENGN_TRACE to a file name to save a timeline of the startup, imports included, to it
+from pygamengn.startup_tracer import StartupTracer
+StartupTracer.enable_from_environment()
+
 import pygame
 import pygamengn
 
@@ -18,29 +21,26 @@ from asteroid_shooter_game import AsteroidShooterGame
 async def main(assets_dir: str = None):
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(filename)s:%(lineno)d: %(message)s")
 
-    t = time.time()
-    pygame.mixer.pre_init(44100, 16, 2, 4096)
-    pygame.init()
-    logging.info(f"Initialized pygame: {time.time() - t:.3f} seconds")
-    t = time.time()
+    with StartupTracer.span("Initialize pygame"):
+        pygame.mixer.pre_init(44100, 16, 2, 4096)
+        pygame.init()
 
     if not assets_dir:
         assets_dir = os.path.join("..", "..", "Assets")
-    factory = await create_factory(assets_dir)
-    logging.info(f"Created factory: {time.time() - t:.3f} seconds")
-    t = time.time()
+    with StartupTracer.span("Create factory"):
+        factory = await create_factory(assets_dir)
 
-    # Create window
-    screen = pygame.display.set_mode((1280, 720), pygame.DOUBLEBUF | pygame.HWSURFACE | pygame.RESIZABLE)
+    with StartupTracer.span("Create window"):
+        # Create window
+        screen = pygame.display.set_mode((1280, 720), pygame.DOUBLEBUF | pygame.HWSURFACE | pygame.RESIZABLE)
 
-    # Initialize window
-    pygame.display.set_icon(factory.images["ship_icon"].surface)
-    pygame.display.set_caption("Asteroid Continuum 1983")
-    logging.info(f"Created window: {time.time() - t:.3f} seconds")
-    t = time.time()
+        # Initialize window
+        pygame.display.set_icon(factory.images["ship_icon"].surface)
+        pygame.display.set_caption("Asteroid Continuum 1983")
 
-    game = factory.create("AsteroidShooterGame", screen=screen)
-    logging.info(f"Created game: {time.time() - t:.3f} seconds")
+    with StartupTracer.span("Create game"):
+        game = factory.create("AsteroidShooterGame", screen=screen)
+    StartupTracer.finish()
 
     clock = pygame.time.Clock()
 
@@ -56,16 +56,37 @@ async def main(assets_dir: str = None):
 
 async def create_factory(assets_dir) -> pygamengn.GameObjectFactory:
     """Instantiates GameObjectFactory, the factory that will create all the game objects."""
-    from inventory.inventory import images, sounds, assets, game_types
+    # packitup can compile the inventory into a file that loads faster than the inventory modules
+    compiled_inventory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "inventory", "inventory.pgi")
+    resolved = os.path.exists(compiled_inventory)
+    if resolved:
+        inventory = pygamengn.load_inventory(compiled_inventory)
+        images, sounds, assets, game_types, roots = (
+            inventory[k] for k in ("images", "sounds", "assets", "game_types", "roots")
+        )
+    else:
+        from inventory.inventory import images, sounds, assets, game_types, roots
     factory = pygamengn.GameObjectFactory(
         pygamengn.ClassRegistrar.registry,
     )
+    # Rotation caches persist between runs on desktop, and ship baked by packitup for the web
+    cache_dir = os.path.join(assets_dir, "rotation_cache")
     await factory.load(
         assets_dir,
         images,
         sounds,
         assets,
-        game_types
+        game_types,
+        cache_dir,
+        workers = os.cpu_count() or 1,
+        # Rotations missing from the cache render on every core. Worker processes take longer to start than they save
+        # on a single core.
+        rotation_workers = os.cpu_count() if (os.cpu_count() or 1) > 1 else 0,
+        # Show the menu as soon as possible in the browser, where downloading and decoding images takes longest
+        stream = sys.platform == "emscripten",
+        priority = ["ship_icon"],
+        resolved = resolved,
+        roots = roots
     )
     factory.set_layer_manager_asset_name("LayerManager")
     return factory
@@ -54,9 +54,9 @@ class Ship(GameObject):
             self.waypoint.visible = True
             self.place_waypoint()
 
-    def attach(self, game_object, offset, take_parent_transform):
+    def attach(self, game_object, offset, take_parent_transform, inherit_heading=True):
         """Attaches a game object to this game object at the give offset."""
-        super().attach(game_object, offset, take_parent_transform)
+        super().attach(game_object, offset, take_parent_transform, inherit_heading)
         try:
             # Set the waypoint to point to -- only applies to NavArrow attachment
             game_object.set_waypoint(self.waypoint)
@@ -4,6 +4,9 @@ import shutil
 import sys
 
 
+# File name of the compiled inventory, next to the inventory modules
+COMPILED_INVENTORY = "inventory.pgi"
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -30,11 +33,30 @@ def main():
         help = "Output directory.",
         default = "."
     )
+    parser.add_argument(
+        "-b", "--bake",
+        help = "Bake the rotations of the images that cache them into atlases that ship with the assets.",
+        action = "store_true"
+    )
+    parser.add_argument(
+        "-c", "--compile-inventory",
+        help = "Validate the inventory and compile it into a file that the sample loads instead of the Python modules.",
+        action = "store_true"
+    )
+    parser.add_argument(
+        "-p", "--prune",
+        help = "Leave out the images and sounds that can't be reached from the roots listed in the sample's inventory.",
+        action = "store_true"
+    )
 
     args = parser.parse_args()
 
     sys.path.append(os.path.join(args.sample_dir, args.inventory_dir))
     from inventory.inventory import fonts, images, sounds
+    if args.bake or args.compile_inventory or args.prune:
+        sys.path.append(os.path.join(args.sample_dir, "..", "..", "src"))
+    if args.prune:
+        images, sounds = prune(images, sounds)
 
     sample_name = os.path.split(args.sample_dir)[-1]
     out_dir = os.path.join(args.out, sample_name)
@@ -64,6 +86,16 @@ def main():
     copy_asset_list([v["kwargs"]["fname"] for v in images.values()], assets_in_dir, assets_out_dir)
     copy_asset_list(sounds.values(), assets_in_dir, assets_out_dir)
 
+    # Bake rotation atlases
+    if args.bake:
+        bake_rotations(images, assets_in_dir, os.path.join(assets_out_dir, "rotation_cache"))
+
+    # Compile inventory
+    if args.compile_inventory:
+        compile_inventory(
+            os.path.join(out_dir, "Samples", sample_name, args.inventory_dir, "inventory", COMPILED_INVENTORY)
+        )
+
     # Copy pygamengn source code
     log(os.path.join(args.sample_dir, "..", "..", "src"), os.path.join(out_dir, "src"))
     shutil.copytree(
@@ -88,6 +120,53 @@ def copy_asset_list(assets: list[str], in_dir: str, out_dir: str):
         shutil.copyfile(os.path.join(in_dir, asset), os.path.join(out_dir, asset))
 
 
+def bake_rotations(images: dict, in_dir: str, cache_dir: str):
+    """Bakes the rotation frames of every image that caches them up front into the rotation cache in cache_dir."""
+    from pygamengn.image_asset import ImageAsset
+
+    for name, image in images.items():
+        kwargs = dict(image["kwargs"])
+        if kwargs.get("cache_rotations") and not kwargs.get("lazy_rotations"):
+            kwargs["fname"] = os.path.join(in_dir, kwargs["fname"])
+            print(f"Baking {name} -> {os.path.abspath(cache_dir)}")
+            ImageAsset(**kwargs).bake(cache_dir)
+
+
+def prune(images: dict, sounds: dict) -> tuple[dict, dict]:
+    """Returns the images and sounds that can be reached from the inventory's roots, and reports the ones that can't."""
+    import copy
+    from inventory.inventory import assets, game_types, roots
+    from pygamengn.inventory import missing_references, reachable_entries, reference_graph, resolve_scopes
+
+    graph = reference_graph(images, sounds, assets, resolve_scopes(copy.deepcopy(game_types)))
+    for node, reference in missing_references(graph):
+        print(f"Missing: {node} -> {reference}")
+    reachable = reachable_entries(graph, roots)
+    for node in sorted(set(graph) - reachable):
+        print(f"Unreachable: {node}")
+    return (
+        {name: image for name, image in images.items() if f"image:{name}" in reachable},
+        {name: sound for name, sound in sounds.items() if f"sound:{name}" in reachable},
+    )
+
+
+def compile_inventory(path: str):
+    """Validates the sample's inventory, resolves its scopes and base types, and writes the result to path."""
+    from inventory import inventory as sample_inventory
+    from inventory.inventory import assets, fonts, game_types, images, sounds
+    from pygamengn.inventory import InventoryError, compile_inventory, save_inventory
+
+    try:
+        inventory = compile_inventory(
+            images, sounds, assets, game_types, fonts, getattr(sample_inventory, "roots", None)
+        )
+    except InventoryError as e:
+        print(e)
+        sys.exit(1)
+    print(f"Compiling inventory -> {os.path.abspath(path)}")
+    save_inventory(path, inventory)
+
+
 def log(src: str, dest: str):
     print(f"{os.path.abspath(src)} -> {os.path.abspath(dest)}")
 
@@ -0,0 +1,54 @@
+import importlib
+import os
+import re
+import unittest
+
+import pygamengn
+
+from pygamengn.class_registrar import ClassRegistrar
+
+
+class TestClassRegistrar(unittest.TestCase):
+
+    def test_modules_cover_registered_classes(self):
+        """Every class that pygamengn registers must be listed in ClassRegistrar.modules under its own module."""
+        package_dir = os.path.dirname(pygamengn.__file__)
+        registered = {}
+        for dir_path, dir_names, file_names in os.walk(package_dir):
+            dir_names[:] = [d for d in dir_names if d not in ("Test", "__pycache__")]
+            for file_name in file_names:
+                if file_name.endswith(".py"):
+                    module = os.path.relpath(os.path.join(dir_path, file_name[:-3]), os.path.dirname(package_dir))
+                    with open(os.path.join(dir_path, file_name)) as f:
+                        for name in re.findall(r'@ClassRegistrar\.register\("(\w+)"\)', f.read()):
+                            registered[name] = module.replace(os.sep, ".")
+        self.assertEqual(registered, ClassRegistrar.modules)
+
+    def test_lookup_imports_module(self):
+        for name, module in ClassRegistrar.modules.items():
+            self.assertEqual(ClassRegistrar.registry[name].__module__, module)
+
+    def test_unknown_class(self):
+        with self.assertRaises(KeyError):
+            ClassRegistrar.registry["Unknown"]
+
+    def test_package_attributes(self):
+        self.assertIs(pygamengn.GameObject, ClassRegistrar.registry["GameObject"])
+        self.assertIn("TexturePanel", dir(pygamengn))
+        with self.assertRaises(AttributeError):
+            pygamengn.Unknown
+
+    def test_public_names_import(self):
+        """Every public name must import from the module it's listed under, and registered classes are public."""
+        self.assertLessEqual(set(ClassRegistrar.modules), set(pygamengn.__all__))
+        for name in pygamengn.__all__:
+            value = getattr(pygamengn, name)
+            self.assertEqual(value.__module__, pygamengn._modules[name], name)
+            if name in ClassRegistrar.modules:
+                self.assertIs(value, ClassRegistrar.registry[name])
+            else:
+                self.assertIs(value, getattr(importlib.import_module(pygamengn._modules[name]), name))
+
+
+if __name__ == "__main__":
+    unittest.main()
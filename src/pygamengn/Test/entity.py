@@ -0,0 +1,97 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from pygamengn.class_registrar import ClassRegistrar
+from pygamengn.collision_manager import CollisionManager
+from pygamengn.game_object import GameObject
+from pygamengn.game_object_factory import GameObjectFactory
+
+
+class TestEntity(unittest.TestCase):
+
+    def setUp(self):
+        with tempfile.TemporaryDirectory() as assets_dir:
+            surface = pygame.Surface((8, 8), pygame.SRCALPHA)
+            surface.fill((255, 255, 255))
+            pygame.image.save(surface, os.path.join(assets_dir, "bullet.png"))
+            images = {"bullet": {"class_name": "ImageAsset", "kwargs": {"fname": "bullet.png"}}}
+            assets = {
+                "RenderGroup": {"class_name": "RenderGroup", "kwargs": {}},
+                "Bullets": {"class_name": "SpriteGroup", "kwargs": {}},
+            }
+            game_types = {
+                "Bullet": {
+                    "class_name": "ProjectileEntity",
+                    "kwargs": {
+                        "image:image_asset": "bullet",
+                        "damage": 15,
+                        "off_screen_ttl": 80,
+                        "game_object:mover": "BulletMover",
+                    },
+                    "groups": ["RenderGroup", "Bullets"],
+                    "pool": {"size": 4},
+                    "BulletMover": {
+                        "class_name": "MoverVelocity",
+                        "kwargs": {"velocity": 1000.0, "max_velocity": 1000.0, "angular_velocity": 0.0},
+                    },
+                },
+            }
+            self.factory = GameObjectFactory(ClassRegistrar.registry)
+            asyncio.run(self.factory.load(assets_dir, images, {}, assets, game_types))
+        self.render_group = self.factory.assets["RenderGroup"]
+        self.bullets = self.factory.assets["Bullets"]
+
+    def test_no_instance_dict(self):
+        bullet = self.factory.create("Bullet")
+        self.assertFalse(hasattr(bullet, "__dict__"))
+        bullet.health = 50
+        with self.assertRaises(AttributeError):
+            bullet.scale = 2.0
+
+    def test_render_group_moves_entity(self):
+        bullet = self.factory.create("Bullet", heading=90)
+        self.assertTrue(bullet.alive())
+        self.render_group.update(pygame.Rect(0, 0, 100, 100), 100)
+        self.assertAlmostEqual(bullet.position.x, -100.0)
+        self.assertAlmostEqual(bullet.position.y, 0.0)
+        self.assertEqual(bullet.rect.center, (-100, 0))
+
+    def test_collision_and_pooling(self):
+        shooter = GameObject(None, is_collidable=False)
+        bullet = self.factory.create("Bullet")
+        bullet.set_parent(shooter)
+        bullet.transform()
+        target = GameObject(bullet.image_asset)
+        target.position = bullet.position
+        target.transform()
+        targets = pygame.sprite.Group(target)
+
+        instigators = []
+        target.take_damage = lambda damage, instigator: instigators.append((damage, instigator))
+        CollisionManager([]).collide_groups(self.bullets, targets)
+        self.assertEqual(instigators, [(15, shooter)])
+        self.assertFalse(bullet.alive())
+        self.assertIs(self.factory.create("Bullet"), bullet)
+
+    def test_create_many_joins_groups(self):
+        bullets = self.factory.create_many("Bullet", 3)
+        self.assertTrue(all(bullet.alive() for bullet in bullets))
+        self.assertEqual(self.bullets.sprites(), bullets)
+        self.assertEqual(len(self.render_group), 3)
+
+    def test_off_screen_ttl(self):
+        bullet = self.factory.create("Bullet")
+        bullet.off_screen_warning = True
+        bullet.update(50)
+        self.assertTrue(bullet.alive())
+        bullet.update(50)
+        self.assertFalse(bullet.alive())
+        self.assertIs(self.factory.create("Bullet"), bullet)
+
+
+if __name__ == "__main__":
+    unittest.main()
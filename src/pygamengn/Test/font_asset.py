@@ -0,0 +1,32 @@
+import unittest
+
+import pygame
+
+from pygamengn.UI.font_asset import FontAsset
+
+
+class TestFontAsset(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def test_same_font_shared(self):
+        small = FontAsset(None, 17)
+        other_small = FontAsset(None, 17)
+        big = FontAsset(None, 31)
+        self.assertIs(small._FontAsset__fonts[17], other_small._FontAsset__fonts[17])
+        self.assertIsNot(small._FontAsset__fonts[17], big._FontAsset__fonts[31])
+
+    def test_fitted_sizes_not_shared(self):
+        """Sizes that get_font_size tries belong to the asset, so they go away with it."""
+        font = FontAsset(None, 19)
+        size = font.get_font_size("Asteroids", (300, 60))
+        self.assertNotEqual(size, 19)
+        self.assertIn(size, font._FontAsset__fonts)
+        self.assertNotIn((None, size), FontAsset._FontAsset__shared_fonts)
+        self.assertIs(FontAsset(None, 19)._FontAsset__fonts[19], font._FontAsset__fonts[19])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from pygamengn.game_object import GameObject
+
+
+class TestGameObject(unittest.TestCase):
+
+    def gob(self, **kwargs):
+        return GameObject(None, is_collidable=False, **kwargs)
+
+    def test_root_parent(self):
+        root, middle, leaf = self.gob(), self.gob(), self.gob()
+        middle.set_parent(root)
+        leaf.set_parent(middle)
+        self.assertIs(leaf.root_parent, root)
+        self.assertIs(GameObject.get_root_parent(leaf), root)
+
+        # The cached root is looked up again when it gets a parent
+        new_root = self.gob()
+        root.set_parent(new_root)
+        self.assertIs(leaf.root_parent, new_root)
+        self.assertIs(root.root_parent, new_root)
+
+    def test_root_parent_after_detaching_middle(self):
+        root, middle, leaf = self.gob(), self.gob(), self.gob()
+        middle.set_parent(root)
+        leaf.set_parent(middle)
+        self.assertIs(leaf.root_parent, root)
+
+        middle.set_parent(None)
+        self.assertIs(leaf.root_parent, middle)
+        self.assertIs(middle.root_parent, middle)
+        self.assertIs(root.root_parent, root)
+
+    def test_reparenting_leaf_keeps_other_roots(self):
+        root, middle, leaf, other = self.gob(), self.gob(), self.gob(), self.gob()
+        middle.set_parent(root)
+        leaf.set_parent(middle)
+        self.assertIs(leaf.root_parent, root)
+        revision = GameObject._GameObjectCore__parents_revision
+
+        # Neither setting the same parent again nor moving a game object without children invalidates other roots
+        leaf.set_parent(middle)
+        projectile = self.gob()
+        projectile.set_parent(leaf)
+        self.assertIs(projectile.root_parent, root)
+        projectile.set_parent(other)
+        self.assertIs(projectile.root_parent, other)
+        self.assertEqual(GameObject._GameObjectCore__parents_revision, revision)
+
+        # Moving a game object with children does
+        middle.set_parent(other)
+        self.assertNotEqual(GameObject._GameObjectCore__parents_revision, revision)
+        self.assertIs(leaf.root_parent, other)
+
+    def test_recycle_clears_parent(self):
+        shooter, bullet = self.gob(), self.gob()
+        bullet.set_parent(shooter)
+        self.assertIs(bullet.root_parent, shooter)
+        revision = GameObject._GameObjectCore__parents_revision
+
+        bullet.recycle()
+        self.assertIsNone(bullet.parent)
+        self.assertIs(bullet.root_parent, bullet)
+        self.assertEqual(GameObject._GameObjectCore__parents_revision, revision)
+        self.assertEqual(shooter._GameObjectCore__child_count, 0)
+
+    def test_attachments_follow_parent(self):
+        parent, child, grandchild, turret = self.gob(), self.gob(), self.gob(), self.gob(heading=45)
+        parent.attach(child, (0.0, -10.0), True)
+        child.attach(grandchild, (5.0, 0.0), True)
+        parent.attach(turret, (0.0, 0.0), True, inherit_heading=False)
+
+        parent.position = (100.0, 100.0)
+        parent.heading = 90
+        parent.place_attachments()
+        self.assertAlmostEqual(child.position.x, 90.0)
+        self.assertAlmostEqual(child.position.y, 100.0)
+        self.assertEqual(child.heading, 90)
+        self.assertAlmostEqual(grandchild.position.x, 90.0)
+        self.assertAlmostEqual(grandchild.position.y, 95.0)
+        self.assertEqual(turret.position, (100.0, 100.0))
+        self.assertEqual(turret.heading, 45)
+
+    def test_static_parent_snaps_back_attachments(self):
+        parent, child = self.gob(heading=90), self.gob()
+        parent.attach(child, (0.0, -10.0), True)
+        parent.place_attachments()
+        self.assertAlmostEqual(child.position.x, -10.0)
+        self.assertEqual(child.heading, 90)
+
+        child.position = (50.0, 50.0)
+        child.heading = 10
+        parent.place_attachments()
+        self.assertAlmostEqual(child.position.x, -10.0)
+        self.assertAlmostEqual(child.position.y, 0.0)
+        self.assertEqual(child.heading, 90)
+
+        # Moving the position in place is caught too
+        child.position.x += 25.0
+        parent.place_attachments()
+        self.assertAlmostEqual(child.position.x, -10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
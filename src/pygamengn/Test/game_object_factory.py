@@ -0,0 +1,184 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+import pygame
+
+from pygamengn.class_registrar import ClassRegistrar
+from pygamengn.game_object import GameObject
+from pygamengn.game_object_factory import GameObjectFactory
+
+
+@ClassRegistrar.register("TestFactoryTimer")
+class Timer(GameObject):
+
+    def __init__(self, **kwargs):
+        super().__init__(None, is_collidable=False, **kwargs)
+        self.elapsed = 0
+
+    def recycle(self, **kwargs):
+        super().recycle(**kwargs)
+        self.elapsed = 0
+
+
+@ClassRegistrar.register("TestFactoryStopwatch")
+class Stopwatch(Timer):
+    """Adds state of its own but inherits recycle, so it can't be pooled."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.laps = []
+
+
+class TestGameObjectFactory(unittest.TestCase):
+
+    def image(self, fname, **kwargs):
+        return {"class_name": "ImageAsset", "kwargs": {"fname": fname, **kwargs}}
+
+    def test_identical_images_shared(self):
+        with tempfile.TemporaryDirectory() as assets_dir:
+            pygame.image.save(pygame.Surface((8, 8), pygame.SRCALPHA), os.path.join(assets_dir, "laser.png"))
+            images = {
+                "laser": self.image("laser.png"),
+                "turret_laser": self.image("./laser.png"),
+                "big_laser": self.image("laser.png", scale=2.0),
+            }
+            factory = GameObjectFactory(ClassRegistrar.registry)
+            asyncio.run(factory.load(assets_dir, images, {}, {}, {}))
+
+        self.assertIs(factory.images["laser"], factory.images["turret_laser"])
+        self.assertIsNot(factory.images["laser"], factory.images["big_laser"])
+        self.assertEqual(factory.images["big_laser"].surface.get_size(), (16, 16))
+
+    def test_streamed_aliases_shared(self):
+        async def load_streamed(factory, assets_dir, images):
+            await factory.load(assets_dir, images, {}, {}, {}, stream=True, priority=["turret_laser"])
+            priority_loaded = factory.images["laser"].loaded
+            while factory.streaming:
+                await asyncio.sleep(0)
+            return priority_loaded
+
+        with tempfile.TemporaryDirectory() as assets_dir:
+            for fname in ("laser.png", "rock.png"):
+                pygame.image.save(pygame.Surface((8, 8), pygame.SRCALPHA), os.path.join(assets_dir, fname))
+            images = {
+                "laser": self.image("laser.png"),
+                "turret_laser": self.image("./laser.png"),
+                "rock": self.image("rock.png"),
+                "small_rock": self.image("rock.png"),
+            }
+            factory = GameObjectFactory(ClassRegistrar.registry)
+            self.assertTrue(asyncio.run(load_streamed(factory, assets_dir, images)))
+
+        self.assertIs(factory.images["laser"], factory.images["turret_laser"])
+        self.assertIs(factory.images["rock"], factory.images["small_rock"])
+        self.assertTrue(all(image.loaded for image in factory.images.values()))
+
+    def pooling_factory(self, class_name):
+        factory = GameObjectFactory(ClassRegistrar.registry)
+        game_types = {"Pooled": {"class_name": class_name, "kwargs": {}, "pool": {"size": 2}}}
+        asyncio.run(factory.load("", {}, {}, {}, game_types))
+        return factory
+
+    def test_pooled_subclass_resets_its_state(self):
+        factory = self.pooling_factory("TestFactoryTimer")
+        timer = factory.create("Pooled")
+        timer.elapsed = 500
+        timer.heading = 45
+        timer.kill()
+
+        recycled = factory.create("Pooled", heading=90)
+        self.assertIs(recycled, timer)
+        self.assertEqual(recycled.elapsed, 0)
+        self.assertEqual(recycled.heading, 90)
+
+    def test_kwargs_recycle_doesnt_take_create_new_objects(self):
+        factory = self.pooling_factory("TestFactoryTimer")
+        timer = factory.create("Pooled")
+        timer.kill()
+
+        created = factory.create("Pooled", damage=5)
+        self.assertIsNot(created, timer)
+        self.assertEqual(created.damage, 5)
+        self.assertIs(factory.create("Pooled"), timer)
+
+    def test_inherited_recycle_isnt_pooled(self):
+        factory = self.pooling_factory("TestFactoryStopwatch")
+        stopwatch = factory.create("Pooled")
+        stopwatch.laps.append(100)
+        stopwatch.kill()
+        self.assertIsNot(factory.create("Pooled"), stopwatch)
+
+    def spawning_factory(self):
+        with tempfile.TemporaryDirectory() as assets_dir:
+            pygame.image.save(pygame.Surface((10, 20), pygame.SRCALPHA), os.path.join(assets_dir, "rock.png"))
+            images = {"rock": self.image("rock.png")}
+            assets = {
+                "RenderGroup": {"class_name": "RenderGroup", "kwargs": {}},
+                "LayerManager": {"class_name": "LayerManager", "kwargs": {"layers": [["Pebble"], ["Rock", "Boulder"]]}},
+            }
+            rock_kwargs = {"image:image_asset": "rock", "is_collidable": False}
+            game_types = {
+                "Rock": {"class_name": "GameObject", "kwargs": rock_kwargs, "groups": ["RenderGroup"], "pool": {"size": 4}},
+                "Pebble": {"class_name": "GameObject", "kwargs": rock_kwargs, "groups": ["RenderGroup"]},
+                "Boulder": {
+                    "class_name": "GameObject",
+                    "kwargs": rock_kwargs,
+                    "groups": ["RenderGroup"],
+                    "attachments": [{"game_type": "Pebble", "offset": [0, -5]}],
+                },
+            }
+            factory = GameObjectFactory(ClassRegistrar.registry)
+            asyncio.run(factory.load(assets_dir, images, {}, assets, game_types))
+        factory.set_layer_manager_asset_name("LayerManager")
+        return factory
+
+    def test_create_many(self):
+        factory = self.spawning_factory()
+        render_group = factory.assets["RenderGroup"]
+        rocks = factory.create_many("Rock", 3, positions=[(0, 0), (100, 50), (-20, 10)], headings=[0, 90, 180])
+        self.assertEqual(len(set(rocks)), 3)
+        self.assertEqual([rock.position for rock in rocks], [(0, 0), (100, 50), (-20, 10)])
+        self.assertEqual([rock.heading for rock in rocks], [0, 90, 180])
+        self.assertEqual(rocks[1].rect.center, (100, 50))
+        self.assertEqual(rocks[1].rect.size, rocks[1].image_asset.get_surface(90).get_size())
+        self.assertEqual(render_group.sprites(), rocks)
+        self.assertEqual([render_group.get_layer_of_sprite(rock) for rock in rocks], [1, 1, 1])
+
+    def test_create_many_adds_in_bulk(self):
+        factory = self.spawning_factory()
+        render_group = factory.assets["RenderGroup"]
+        with mock.patch.object(render_group, "add", wraps=render_group.add) as add:
+            rocks = factory.create_many("Rock", 4)
+        add.assert_called_once_with(*rocks)
+        self.assertEqual(render_group.sprites(), rocks)
+
+    def test_create_many_recycles_pooled_objects(self):
+        factory = self.spawning_factory()
+        rocks = factory.create_many("Rock", 2)
+        rocks[0].heading = 45
+        for rock in rocks:
+            rock.kill()
+        recycled = factory.create_many("Rock", 3, headings=[10, 20, 30])
+        self.assertEqual(recycled[:2], rocks)
+        self.assertNotIn(recycled[2], rocks)
+        self.assertEqual([rock.heading for rock in recycled], [10, 20, 30])
+        self.assertTrue(all(rock.alive() for rock in recycled))
+
+    def test_create_many_attachments(self):
+        factory = self.spawning_factory()
+        boulders = factory.create_many("Boulder", 2, positions=[(0, 0), (50, 50)])
+        render_group = factory.assets["RenderGroup"]
+        for boulder in boulders:
+            self.assertEqual(len(boulder.attachments), 1)
+            pebble = boulder.attachments[0].game_object
+            self.assertIs(pebble.parent, boulder)
+            self.assertEqual(render_group.get_layer_of_sprite(pebble), 0)
+        self.assertEqual(len(render_group), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from pygamengn.image_asset import ImageAsset
+
+
+class TestImageAsset(unittest.TestCase):
+
+    def setUp(self):
+        self.assets_dir = tempfile.TemporaryDirectory()
+        self.fname = os.path.join(self.assets_dir.name, "ship.png")
+        surface = pygame.Surface((30, 12), pygame.SRCALPHA)
+        surface.fill((255, 0, 0))
+        pygame.image.save(surface, self.fname)
+
+    def tearDown(self):
+        self.assets_dir.cleanup()
+
+    def test_placeholders_match_frames(self):
+        for kwargs in ({}, {"angle": 30, "scale": 1.5}, {"angle": 90, "cache_rotations": True, "rotation_frames": 8}):
+            streamed = ImageAsset(self.fname, stream=True, **kwargs)
+            loaded = ImageAsset(self.fname, **kwargs)
+            for rotation in (0, 45, 90, 200):
+                placeholder_size = streamed.get_surface(rotation).get_size()
+                self.assertEqual(placeholder_size, loaded.get_surface(rotation).get_size(), (kwargs, rotation))
+                self.assertEqual(streamed.get_mask(rotation).get_size(), placeholder_size)
+            self.assertEqual(streamed.surface.get_size(), loaded.surface.get_size())
+
+            streamed.load()
+            self.assertEqual(streamed.get_surface(45).get_size(), loaded.get_surface(45).get_size())
+
+
+if __name__ == "__main__":
+    unittest.main()
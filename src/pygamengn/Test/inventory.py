@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+
+from pygamengn.inventory import (
+    BASE_TYPES_KEY,
+    InventoryError,
+    compile_inventory,
+    load_inventory,
+    missing_references,
+    reachable_entries,
+    reference_graph,
+    resolve_scopes,
+    save_inventory,
+)
+
+
+class TestInventory(unittest.TestCase):
+
+    def game_types(self):
+        return {
+            "Base": {
+                "class_name": "GameObject",
+                "kwargs": {"image:image_asset": "ship", "game_object:mover": "Mover"},
+                "groups": ["Group"],
+                "Mover": {"class_name": "MoverVelocity", "kwargs": {}},
+            },
+            "Derived": {
+                "base_type": "Base",
+                "kwargs": {"scale": 2.0},
+            },
+            "Folder": {
+                "Nested": {"class_name": "GameObject", "kwargs": {"type_spec:spawn": "/Derived"}},
+            },
+        }
+
+    def compile(self, game_types=None):
+        images = {"ship": {"class_name": "ImageAsset", "kwargs": {"fname": "ship.png"}}}
+        assets = {"Group": {"class_name": "SpriteGroup", "kwargs": {}}}
+        return compile_inventory(images, {}, assets, game_types or self.game_types())
+
+    def test_resolve_scopes(self):
+        game_types = resolve_scopes(self.game_types())
+        self.assertEqual(game_types["Base"]["kwargs"]["game_object:mover"], "/Base/Mover")
+
+    def test_base_types_merged(self):
+        derived = self.compile()["game_types"]["Derived"]
+        self.assertNotIn("base_type", derived)
+        self.assertEqual(derived[BASE_TYPES_KEY], ["Base"])
+        self.assertEqual(derived["class_name"], "GameObject")
+        self.assertEqual(derived["kwargs"]["scale"], 2.0)
+        self.assertEqual(derived["kwargs"]["game_object:mover"], "/Base/Mover")
+
+    def test_input_untouched(self):
+        game_types = self.game_types()
+        self.compile(game_types)
+        self.assertEqual(game_types, self.game_types())
+
+    def test_broken_references(self):
+        game_types = self.game_types()
+        game_types["Derived"]["base_type"] = "Missing"
+        game_types["Base"]["kwargs"]["image:image_asset"] = "missing_image"
+        game_types["Base"]["groups"].append("MissingGroup")
+        game_types["Folder"]["Nested"]["kwargs"]["type_spec:spawn"] = "/Nowhere"
+        with self.assertRaises(InventoryError) as context:
+            self.compile(game_types)
+        message = str(context.exception)
+        for missing in ("Missing", "missing_image", "MissingGroup", "/Nowhere"):
+            self.assertIn(missing, message)
+
+    def test_reference_graph(self):
+        images = {"ship": {}, "unused": {}}
+        graph = reference_graph(images, {"shot": "shot.ogg"}, {"Group": {}}, resolve_scopes(self.game_types()))
+        self.assertEqual(
+            graph["game_object:/Base"], {"image:ship", "game_object:/Base/Mover", "asset:Group"}
+        )
+        self.assertEqual(graph["game_object:/Derived"], {"game_object:/Base"})
+        self.assertEqual(graph["game_object:/Folder/Nested"], {"game_object:/Derived"})
+        self.assertEqual(missing_references(graph), [])
+
+        reachable = reachable_entries(graph, ["game_object:Folder/Nested"])
+        self.assertIn("image:ship", reachable)
+        self.assertIn("game_object:/Base/Mover", reachable)
+        self.assertNotIn("image:unused", reachable)
+        self.assertNotIn("sound:shot", reachable)
+
+    def test_save_load(self):
+        inventory = self.compile()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "inventory.pgi")
+            save_inventory(path, inventory)
+            self.assertEqual(load_inventory(path), inventory)
+
+    def test_load_not_inventory(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "inventory.pgi")
+            with open(path, "wb") as f:
+                f.write(b"not an inventory")
+            with self.assertRaises(InventoryError):
+                load_inventory(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
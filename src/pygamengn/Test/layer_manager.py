@@ -0,0 +1,43 @@
+import unittest
+
+from pygamengn.layer_manager import LayerManager
+
+
+class TestLayerManager(unittest.TestCase):
+
+    def setUp(self):
+        self.layer_manager = LayerManager([
+            ["Projectile"],
+            ["Ship", "/PlayerShip/Shield"],
+            ["Asteroid", "Projectile"],
+            ["AsteroidBase"],
+        ])
+
+    def test_get_layer_id(self):
+        self.assertEqual(self.layer_manager.get_layer_id("Ship"), 1)
+        self.assertEqual(self.layer_manager.get_layer_id("Asteroid"), 2)
+        self.assertEqual(self.layer_manager.get_layer_id("Unknown"), LayerManager.INVALID_LAYER_ID)
+
+    def test_first_layer_wins(self):
+        self.assertEqual(self.layer_manager.get_layer_id("Projectile"), 0)
+
+    def test_scoped_names(self):
+        self.assertEqual(self.layer_manager.get_layer_id("/PlayerShip/Shield"), 1)
+        self.assertEqual(self.layer_manager.get_layer_id("PlayerShip/Shield"), 1)
+
+    def test_resolve_order(self):
+        resolve = self.layer_manager.resolve_layer_id
+        self.assertEqual(resolve("/PlayerShip/Shield", "Asteroid"), 1)
+        self.assertEqual(resolve("AsteroidBig", "Asteroid"), 2)
+        self.assertEqual(resolve("AsteroidBig", "Asteroid", ["AsteroidBase"]), 3)
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(resolve("Nothing", "Nowhere"), LayerManager.INVALID_LAYER_ID)
+
+    def test_layers_reindexed(self):
+        self.layer_manager.layers = [["Asteroid"]]
+        self.assertEqual(self.layer_manager.get_layer_id("Asteroid"), 0)
+        self.assertEqual(self.layer_manager.get_layer_id("Ship"), LayerManager.INVALID_LAYER_ID)
+
+
+if __name__ == "__main__":
+    unittest.main()
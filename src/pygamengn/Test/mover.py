@@ -0,0 +1,34 @@
+import unittest
+
+import pygame
+
+from pygamengn.mover import MoverVelDir, MoverVelocity
+
+
+class TestMover(unittest.TestCase):
+
+    def test_velocity_moves_along_heading(self):
+        mover = MoverVelocity(100, 100, 0)
+        position, heading = mover.move(500, pygame.Vector2(0, 0), 90)
+        self.assertAlmostEqual(position.x, -50.0)
+        self.assertAlmostEqual(position.y, 0.0)
+        self.assertEqual(heading, 90)
+
+    def test_set_velocity_restarts_decay(self):
+        mover = MoverVelocity(100, 100, 0, 100)
+        mover.move(100, pygame.Vector2(0, 0), 0)
+        self.assertEqual(mover.velocity, 0)
+        mover.set_velocity(100)
+        mover.move(50, pygame.Vector2(0, 0), 0)
+        self.assertAlmostEqual(mover.velocity, 50)
+
+    def test_vel_dir_recycle(self):
+        mover = MoverVelDir(10, pygame.Vector2(1, 0))
+        mover.set_direction(pygame.Vector2(0, 1))
+        self.assertEqual(mover.move(500), (0.0, 5.0))
+        mover.recycle()
+        self.assertEqual(mover.move(500), (5.0, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
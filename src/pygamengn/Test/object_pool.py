@@ -0,0 +1,28 @@
+import unittest
+
+from pygamengn.object_pool import ObjectPool
+
+
+class TestObjectPool(unittest.TestCase):
+
+    def test_acquire_empty(self):
+        self.assertIsNone(ObjectPool(4).acquire())
+
+    def test_first_in_first_out(self):
+        pool = ObjectPool(4)
+        a, b = object(), object()
+        pool.release(a)
+        pool.release(b)
+        self.assertIs(pool.acquire(), a)
+        self.assertIs(pool.acquire(), b)
+        self.assertIsNone(pool.acquire())
+
+    def test_full(self):
+        pool = ObjectPool(1)
+        self.assertTrue(pool.release(object()))
+        self.assertFalse(pool.release(object()))
+        self.assertEqual(len(pool), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+import pygame
+
+from pygamengn.rotation_cache import RotationCache
+
+
+class TestRotationCache(unittest.TestCase):
+
+    def frames(self):
+        frame = pygame.Surface((4, 2), pygame.SRCALPHA)
+        frame.fill((10, 20, 30, 40))
+        return [frame, frame, pygame.Surface((2, 4), pygame.SRCALPHA)]
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = RotationCache(cache_dir)
+            frames = self.frames()
+            cache.save("key", frames)
+            loaded = cache.load("key")
+            self.assertEqual([frame.get_size() for frame in loaded], [(4, 2), (4, 2), (2, 4)])
+            self.assertIs(loaded[0], loaded[1])
+            self.assertEqual(tuple(loaded[0].get_at((0, 0))), (10, 20, 30, 40))
+
+    def test_failed_save_leaves_no_files(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = RotationCache(cache_dir)
+            with mock.patch("os.replace", side_effect=OSError("No space left on device")):
+                cache.save("key", self.frames())
+            self.assertEqual(os.listdir(cache_dir), [])
+            self.assertIsNone(cache.load("key"))
+
+    def test_other_pygame_version_renders_again(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = RotationCache(cache_dir)
+            with mock.patch.object(pygame.version, "ver", "2.0.0"):
+                cache.save("key", self.frames())
+                self.assertIsNotNone(cache.load("key"))
+            self.assertIsNone(cache.load("key"))
+
+
+if __name__ == "__main__":
+    unittest.main()
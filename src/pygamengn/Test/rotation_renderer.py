@@ -0,0 +1,56 @@
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from pygamengn.rotation_renderer import RotationRenderer
+
+
+class TestRotationRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.surface = pygame.Surface((24, 16), pygame.SRCALPHA)
+        self.surface.fill((255, 0, 0, 255), pygame.Rect(0, 0, 12, 16))
+        self.surface.fill((0, 0, 255, 128), pygame.Rect(12, 4, 12, 8))
+        self.executor = ThreadPoolExecutor(2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_matches_rotozoom(self):
+        renderer = RotationRenderer(self.executor, 2)
+        angles = [float(angle) for angle in range(0, 360, 10)]
+        frames = renderer.render(self.surface, angles, 0.75)
+        self.assertEqual(len(frames), len(angles))
+        for angle, frame in zip(angles, frames):
+            expected = pygame.transform.rotozoom(self.surface, angle, 0.75)
+            self.assertEqual(frame.get_size(), expected.get_size())
+            self.assertEqual(pygame.image.tobytes(frame, "RGBA"), pygame.image.tobytes(expected, "RGBA"))
+
+    def test_more_workers_than_frames(self):
+        renderer = RotationRenderer(self.executor, 16)
+        self.assertEqual(len(renderer.render(self.surface, [0.0, 90.0, 180.0], 1.0)), 3)
+
+    def test_executor_created_on_first_render(self):
+        created = []
+
+        def create_executor():
+            created.append(self.executor)
+            return self.executor
+
+        renderer = RotationRenderer(create_executor, 1)
+        self.assertFalse(renderer.started)
+        renderer.render(self.surface, [0.0, 45.0], 1.0)
+        renderer.render(self.surface, [90.0], 1.0)
+        self.assertTrue(renderer.started)
+        self.assertEqual(created, [self.executor])
+
+    def test_unstarted_shutdown(self):
+        renderer = RotationRenderer(lambda: self.fail("The executor shouldn't be created"), 2)
+        renderer.shutdown()
+        self.assertFalse(renderer.started)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from pygamengn.startup_tracer import StartupTracer
+
+
+class TestStartupTracer(unittest.TestCase):
+
+    def tearDown(self):
+        StartupTracer.disable()
+
+    def test_disabled(self):
+        StartupTracer.enable(trace_imports=False)
+        StartupTracer.disable()
+        with StartupTracer.span("Ignored"):
+            pass
+        self.assertEqual(StartupTracer.events(), [])
+
+    def test_nested_spans(self):
+        StartupTracer.enable(trace_imports=False)
+        with StartupTracer.span("Outer"):
+            with StartupTracer.span("ship", "image", scale=1.0):
+                pass
+        inner, outer = StartupTracer.events()
+        self.assertEqual((inner["name"], inner["cat"], inner["args"]), ("ship", "image", {"scale": 1.0}))
+        self.assertEqual(outer["name"], "Outer")
+        self.assertLessEqual(outer["ts"], inner["ts"])
+        self.assertGreaterEqual(outer["ts"] + outer["dur"], inner["ts"] + inner["dur"])
+
+    def test_summary(self):
+        StartupTracer.enable(trace_imports=False)
+        for name in ("ship", "rock"):
+            with StartupTracer.span(name, "image"):
+                pass
+        with StartupTracer.span("Not an asset"):
+            pass
+        summary = StartupTracer.summary(1)
+        self.assertIn("of 2 ", summary)
+        self.assertEqual(len(summary.splitlines()), 2)
+        self.assertNotIn("Not an asset", summary)
+
+    def test_imports(self):
+        sys.modules.pop("colorsys", None)
+        StartupTracer.enable()
+        import colorsys
+        StartupTracer.disable()
+        self.assertIn(("colorsys", "import"), [(e["name"], e["cat"]) for e in StartupTracer.events()])
+
+    def test_save(self):
+        StartupTracer.enable(trace_imports=False)
+        with StartupTracer.span("Outer"):
+            pass
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "trace.json")
+            StartupTracer.save(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f)["traceEvents"], StartupTracer.events())
+
+
+if __name__ == "__main__":
+    unittest.main()
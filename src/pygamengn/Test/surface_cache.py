@@ -0,0 +1,56 @@
+import unittest
+
+import pygame
+
+from pygamengn.surface_cache import SurfaceCache
+
+
+class TestSurfaceCache(unittest.TestCase):
+
+    def surface(self, width=4, height=4):
+        return pygame.Surface((width, height), pygame.SRCALPHA)
+
+    def test_get_missing(self):
+        cache = SurfaceCache(1024)
+        self.assertIsNone(cache.get("missing"))
+
+    def test_put_get(self):
+        cache = SurfaceCache(1024)
+        surface = self.surface()
+        cache.put("a", surface)
+        self.assertIs(cache.get("a"), surface)
+        self.assertEqual(cache.size, SurfaceCache.surface_size(surface))
+
+    def test_evicts_least_recently_used(self):
+        cache = SurfaceCache(3 * 64)
+        cache.put("a", self.surface())
+        cache.put("b", self.surface())
+        cache.put("c", self.surface())
+        cache.get("a")
+        cache.put("d", self.surface())
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 3)
+
+    def test_keeps_oversized_entry(self):
+        cache = SurfaceCache(16)
+        cache.put("a", self.surface())
+        cache.put("b", self.surface(8, 8))
+        self.assertNotIn("a", cache)
+        self.assertIn("b", cache)
+
+    def test_shrink_budget(self):
+        cache = SurfaceCache(4 * 64)
+        for key in "abcd":
+            cache.put(key, self.surface())
+        cache.budget = 2 * 64
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 2 * 64)
+
+    def test_explicit_size(self):
+        cache = SurfaceCache(100)
+        cache.put("mask", object(), 40)
+        self.assertEqual(cache.size, 40)
+
+    if __name__ == "__main__":
+        unittest.main()
@@ -0,0 +1,46 @@
+import random
+import unittest
+
+import pygame
+
+from pygamengn.surface_packer import SkylinePacker
+
+
+class TestSkylinePacker(unittest.TestCase):
+
+    def test_first_rect_at_origin(self):
+        packer = SkylinePacker(64, 64)
+        self.assertEqual(tuple(packer.insert(10, 20)), (0, 0, 10, 20))
+
+    def test_fills_row_before_stacking(self):
+        packer = SkylinePacker(64, 64, padding=0)
+        self.assertEqual(tuple(packer.insert(32, 10)), (0, 0, 32, 10))
+        self.assertEqual(tuple(packer.insert(32, 10)), (32, 0, 32, 10))
+        self.assertEqual(tuple(packer.insert(32, 10)), (0, 10, 32, 10))
+
+    def test_exact_fit(self):
+        packer = SkylinePacker(64, 64, padding=0)
+        self.assertIsNotNone(packer.insert(64, 64))
+        self.assertIsNone(packer.insert(1, 1))
+
+    def test_too_big(self):
+        packer = SkylinePacker(64, 64)
+        self.assertIsNone(packer.insert(65, 10))
+        self.assertIsNone(packer.insert(10, 65))
+
+    def test_no_overlaps(self):
+        random.seed(1)
+        packer = SkylinePacker(256, 256)
+        rects = []
+        while True:
+            rect = packer.insert(random.randint(4, 40), random.randint(4, 40))
+            if rect is None:
+                break
+            self.assertTrue(pygame.Rect(0, 0, 256, 256).contains(rect))
+            self.assertEqual(rect.collidelist(rects), -1)
+            rects.append(rect)
+        self.assertGreater(len(rects), 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
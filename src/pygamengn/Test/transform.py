@@ -0,0 +1,40 @@
+import unittest
+
+import numpy
+
+from pygamengn.transform import Transform
+
+
+class TestTransform(unittest.TestCase):
+
+    def reference_matrix(self, translation, theta, scale):
+        """The transform as it used to be built, by multiplying translation, rotation and scale matrices."""
+        rad = numpy.deg2rad(-theta)
+        r = numpy.array([[numpy.cos(rad), -numpy.sin(rad), 0.0], [numpy.sin(rad), numpy.cos(rad), 0.0], [0, 0, 1]])
+        t = Transform.translation_matrix(translation)
+        s = Transform.scale_matrix(scale)
+        return numpy.dot(numpy.dot(t, r), s)
+
+    def test_apply_matches_matrices(self):
+        point = (3.0, -7.5)
+        for translation, theta, scale in (((0, 0), 0, 1.0), ((10, -4), 90, 1.0), ((1.5, 2), 37, 2.0), ((0, 0), 12.5, 0.5)):
+            t = Transform(translation, theta, scale)
+            expected = numpy.dot(self.reference_matrix(translation, theta, scale), (*point, 1.0))
+            numpy.testing.assert_allclose(t.matrix, self.reference_matrix(translation, theta, scale), atol=1e-12)
+            numpy.testing.assert_allclose(tuple(t.apply(point)), expected[:2], atol=1e-12)
+
+    def test_apply_many(self):
+        t = Transform((5, 5), 30, 1.5)
+        points = numpy.array([[0.0, 0.0], [1.0, 2.0], [-3.0, 4.0]])
+        transformed = t.apply_many(points)
+        for point, expected in zip(points, transformed):
+            numpy.testing.assert_allclose(tuple(t.apply(point)), expected, atol=1e-12)
+
+    def test_whole_and_fractional_degrees(self):
+        numpy.testing.assert_allclose(tuple(Transform.rotate((1, 0), 90)), (0, 1), atol=1e-12)
+        numpy.testing.assert_allclose(tuple(Transform.rotate((1, 0), -270)), (0, 1), atol=1e-12)
+        numpy.testing.assert_allclose(tuple(Transform.rotate((1, 0), 90.0)), (0, 1), atol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,12 +16,19 @@ class FontAsset(GameObjectBase):
     """Default monospace font that is always available through FontAsset.monospace()."""
     __monospace_font_asset = None
 
+    """
+    Base size font of every FontAsset by file name and size, so that assets of the same font share it. Other sizes,
+    like the ones that get_font_size tries, belong to the asset that asked for them and go away with it.
+    """
+    __shared_fonts = {}
+
     def __init__(self, fname: str, size: int, **kwargs):
         super().__init__(**kwargs)
         self.__fname = fname
+        self.__font_key = tuple(fname) if isinstance(fname, list) else fname
         self.__size = size
         self.__fonts = {}
-        self.__get_font(size)
+        self.__fonts[size] = self.__get_shared_font(size)
 
 
     def render(
@@ -77,17 +84,30 @@ class FontAsset(GameObjectBase):
         try:
             font = self.__fonts[size]
         except KeyError:
-            try:
-                font = pygame.font.Font(self.__fname, size)
-            except (TypeError, RuntimeError) as e:
-                font = pygame.font.SysFont(self.__fname, size)
-                self.__fname = [font.name]
+            font = self.__load_font(size)
             self.__fonts[size] = font
-            logging.debug(f"Added size {size} for {self.__fname}")
 
         return font
 
 
+    def __get_shared_font(self, size: int) -> pygame.font.Font:
+        font = FontAsset.__shared_fonts.get((self.__font_key, size))
+        if font is None:
+            font = self.__load_font(size)
+            FontAsset.__shared_fonts[(self.__font_key, size)] = font
+        return font
+
+
+    def __load_font(self, size: int) -> pygame.font.Font:
+        try:
+            font = pygame.font.Font(self.__fname, size)
+        except (TypeError, RuntimeError) as e:
+            font = pygame.font.SysFont(self.__fname, size)
+            self.__fname = [font.name]
+        logging.debug(f"Added size {size} for {self.__fname}")
+        return font
+
+
     @classmethod
     def monospace(cls) -> FontAsset:
         if cls.__monospace_font_asset is None:
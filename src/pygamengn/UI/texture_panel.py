@@ -27,6 +27,7 @@ class TexturePanel(Panel):
     ):
         super().__init__(**kwargs)
         self._image_asset = image_asset
+        self._image_revision = image_asset.revision
         self._scale_texture_to_rect = scale_texture_to_rect
         self._angle = angle
         self._angle_changed = True
@@ -72,9 +73,14 @@ class TexturePanel(Panel):
     @property
     def _needs_redraw(self) -> bool:
         """Spinner redraws its surface on every frame."""
-        return super()._needs_redraw or self._angle_changed
+        return (
+            super()._needs_redraw or
+            self._angle_changed or
+            self._image_revision != self._image_asset.revision
+        )
 
 
     def _reset_redraw_flags(self):
         super()._reset_redraw_flags()
         self._angle_changed = False
+        self._image_revision = self._image_asset.revision
@@ -1,31 +1,94 @@
-from pygamengn.animated_texture import AnimatedTexture
-from pygamengn.atlas import Atlas
-from pygamengn.class_registrar import ClassRegistrar
-from pygamengn.collision_manager import CollisionManager
-from pygamengn.console_registrar import ConsoleRegistrar
-from pygamengn.game import Game, BlitSurface
-from pygamengn.game_object import GameObject
-from pygamengn.game_object_base import GameObjectBase
-from pygamengn.game_object_factory import GameObjectFactory, TypeSpec
-from pygamengn.health_bar import HealthBar
-from pygamengn.layer_manager import LayerManager
-from pygamengn.level import Level
-from pygamengn.mover import Mover, MoverVelocity, MoverVelDir
-from pygamengn.projectile import Projectile
-from pygamengn.render_group import RenderGroup
-from pygamengn.replication_manager import ReplicationManager
-from pygamengn.sprite_group import SpriteGroup
-from pygamengn.trigger import Trigger
-from pygamengn.updatable import Updatable
-
-from pygamengn.network.client import Client
-from pygamengn.network.server import Server
-
-from pygamengn.UI.colour_panel import ColourPanel
-from pygamengn.UI.component import Component
-from pygamengn.UI.font_asset import FontAsset
-from pygamengn.UI.panel import Panel
-from pygamengn.UI.root import Root
-from pygamengn.UI.spinner import Spinner
-from pygamengn.UI.text_panel import TextPanel
-from pygamengn.UI.texture_panel import TexturePanel
+"""
+pygamengn imports the module of each of its public names the first time the name is used, rather than when the package
+is imported (PEP 562), so that games only pay for the import of the parts of the engine that they use.
+"""
+import importlib
+
+
+# Module of every class that pygamengn registers with ClassRegistrar, which imports the module the first time the class
+# is looked up. These classes are public names of the package too.
+_class_modules = {
+    "AnimatedTexture": "pygamengn.animated_texture",
+    "Atlas": "pygamengn.atlas",
+    "CollisionManager": "pygamengn.collision_manager",
+    "DefaultInputHandler": "pygamengn.input_handler",
+    "Entity": "pygamengn.entity",
+    "Game": "pygamengn.game",
+    "GameObject": "pygamengn.game_object",
+    "HealthBar": "pygamengn.health_bar",
+    "ImageAsset": "pygamengn.image_asset",
+    "InputHandler": "pygamengn.input_handler",
+    "LayerManager": "pygamengn.layer_manager",
+    "Level": "pygamengn.level",
+    "LevelObject": "pygamengn.level",
+    "MoverTime": "pygamengn.mover",
+    "MoverVelDir": "pygamengn.mover",
+    "MoverVelocity": "pygamengn.mover",
+    "Projectile": "pygamengn.projectile",
+    "ProjectileEntity": "pygamengn.projectile",
+    "RenderGroup": "pygamengn.render_group",
+    "ReplicationManager": "pygamengn.replication_manager",
+    "SpriteGroup": "pygamengn.sprite_group",
+    "Trigger": "pygamengn.trigger",
+    "ColourPanel": "pygamengn.UI.colour_panel",
+    "Component": "pygamengn.UI.component",
+    "Console": "pygamengn.UI.console",
+    "CornerRadii": "pygamengn.UI.colour_panel",
+    "FontAsset": "pygamengn.UI.font_asset",
+    "Fps": "pygamengn.UI.fps",
+    "Panel": "pygamengn.UI.panel",
+    "Root": "pygamengn.UI.root",
+    "Spinner": "pygamengn.UI.spinner",
+    "TextPanel": "pygamengn.UI.text_panel",
+    "TexturePanel": "pygamengn.UI.texture_panel",
+}
+
+# Module that defines each public name
+_modules = {
+    **_class_modules,
+
+    "ClassRegistrar": "pygamengn.class_registrar",
+    "ConsoleRegistrar": "pygamengn.console_registrar",
+    "BlitSurface": "pygamengn.blit_surface",
+    "GameObjectBase": "pygamengn.game_object_base",
+    "GameObjectCore": "pygamengn.game_object_core",
+    "GameObjectFactory": "pygamengn.game_object_factory",
+    "TypeSpec": "pygamengn.game_object_factory",
+    "InventoryError": "pygamengn.inventory",
+    "compile_inventory": "pygamengn.inventory",
+    "load_inventory": "pygamengn.inventory",
+    "missing_references": "pygamengn.inventory",
+    "reachable_entries": "pygamengn.inventory",
+    "reference_graph": "pygamengn.inventory",
+    "save_inventory": "pygamengn.inventory",
+    "Mover": "pygamengn.mover",
+    "ProjectileMixin": "pygamengn.projectile",
+    "ObjectPool": "pygamengn.object_pool",
+    "StartupTracer": "pygamengn.startup_tracer",
+    "SurfaceAtlas": "pygamengn.surface_atlas",
+    "SurfaceCache": "pygamengn.surface_cache",
+    "Updatable": "pygamengn.updatable",
+
+    "Client": "pygamengn.network.client",
+    "Server": "pygamengn.network.server",
+}
+
+__all__ = list(_modules)
+
+
+def __getattr__(name: str):
+    module = _modules.get(name)
+    if module is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    if name in _class_modules:
+        # Registered classes may be nested in other classes, so get them from the registry rather than their module
+        from pygamengn.class_registrar import ClassRegistrar
+        value = ClassRegistrar.registry[name]
+    else:
+        value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_modules))
@@ -20,6 +20,13 @@ class AnimatedTexture(GameObject):
         self.is_playing = False
         self.atlas_index = 0
 
+    def recycle(self, **kwargs):
+        super().recycle(**kwargs)
+        self._dirty_image = False
+        self.animation_time = 0
+        self.is_playing = False
+        self.atlas_index = 0
+
     def update(self, delta):
         super().update(delta)
 
@@ -1,10 +1,26 @@
+import importlib
 import logging
 
 from typing import Callable
 
+from pygamengn import _class_modules
 from pygamengn.game_object_base import GameObjectBase
 
 
+class _Registry(dict):
+    """Dictionary of registered classes that imports the module of a pygamengn class the first time it's looked up."""
+
+    def __missing__(self, name: str):
+        module = ClassRegistrar.modules.get(name)
+        if module is None:
+            raise KeyError(name)
+        # Importing the module registers its classes
+        importlib.import_module(module)
+        if name not in self:
+            raise KeyError(name)
+        return self[name]
+
+
 class ClassRegistrar:
     """
     Every GameObjectBase child class can register itself with the class registrar to make itself loadable.
@@ -13,7 +29,12 @@ class ClassRegistrar:
     https://medium.com/@geoffreykoh/implementing-the-factory-pattern-via-dynamic-registry-and-python-decorators-479fc1537bbe
     """
 
-    registry = {}
+    registry = _Registry()
+
+    # Module of every class that pygamengn registers (see pygamengn/__init__.py). Modules are only imported when
+    # GameObjectFactory first looks up one of their classes, so that games don't pay for the import of the parts of
+    # pygamengn that they don't use.
+    modules = _class_modules
 
     @classmethod
     def register(cls, name: str) -> Callable:
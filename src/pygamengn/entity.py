@@ -0,0 +1,82 @@
+from pygamengn.class_registrar import ClassRegistrar
+from pygamengn.game_object_core import GameObjectCore
+
+
+@ClassRegistrar.register("Entity")
+class Entity(GameObjectCore):
+    """
+    Compact game object for the many simple objects of a game, like projectiles and debris.
+
+    Entities keep their state in __slots__ rather than in a per-instance __dict__, which makes them a fraction of the
+    size of a GameObject and quicker to read and write. In exchange, they have no scale, alpha, attachments or
+    replication. They follow the sprite protocol of pygame groups without being pygame Sprites, so they can still be
+    added to RenderGroups and collision groups, and be created and pooled by GameObjectFactory.
+
+    Add entities to groups with add_to_groups, like GameObjectFactory does. Group.add only takes its quick path for
+    Sprites, and first tries to iterate anything else, so adding an entity with it costs a caught exception.
+    """
+
+    __slots__ = ("__groups",)
+
+    def __init__(self,
+                 image_asset,
+                 mover=None,
+                 is_collidable=True,
+                 visible=True,
+                 heading=0,
+                 health=100,
+                 death_effect=None,
+                 damage=0,
+                 kill_when_off_screen=False,
+                 off_screen_ttl=0
+    ):
+        GameObjectCore.__init__(
+            self,
+            image_asset,
+            is_collidable=is_collidable,
+            visible=visible,
+            heading=heading,
+            health=health,
+            death_effect=death_effect,
+            damage=damage,
+            kill_when_off_screen=kill_when_off_screen,
+            off_screen_ttl=off_screen_ttl
+        )
+        self.__groups = {}
+        self.mover = mover
+
+    def recycle(self, heading=None, visible=None):
+        """Resets the entity to the state it was created in, like GameObject.recycle."""
+        super().recycle(heading=heading, visible=visible)
+
+    def add_internal(self, group):
+        """Called by pygame groups when the entity is added to them."""
+        self.__groups[group] = 0
+
+    def remove_internal(self, group):
+        """Called by pygame groups when the entity is removed from them."""
+        del self.__groups[group]
+
+    def add_to_groups(self, groups):
+        """Adds the entity to the given sprite groups."""
+        for group in groups:
+            if group not in self.__groups:
+                group.add_internal(self)
+                self.__groups[group] = 0
+
+    def groups(self) -> list:
+        return list(self.__groups)
+
+    def alive(self) -> bool:
+        return bool(self.__groups)
+
+    def kill(self):
+        """Removes the entity from all its groups, and returns it to its pool if it has one."""
+        for group in self.__groups:
+            group.remove_internal(self)
+        self.__groups.clear()
+        self._return_to_pool()
+
+    @property
+    def layer(self) -> int:
+        return self._layer
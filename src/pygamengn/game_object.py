@@ -1,16 +1,14 @@
 import pygame
 
-from pygamengn.blit_surface import BlitSurface
 from pygamengn.class_registrar import ClassRegistrar
-from pygamengn.game_object_base import GameObjectBase
-from pygamengn.geometry import normalize_angle
+from pygamengn.game_object_core import GameObjectCore
 from pygamengn.network.replicated_property import ReplicatedProperty
 from pygamengn.transform import Transform
 
 
 @ClassRegistrar.register("GameObject")
-class GameObject(pygame.sprite.Sprite, GameObjectBase):
-    """Basic game object."""
+class GameObject(GameObjectCore, pygame.sprite.Sprite):
+    """Basic game object. Adds scale, alpha, attachments and replication to GameObjectCore."""
 
     def __init__(self,
                  image_asset,
@@ -25,31 +23,45 @@ class GameObject(pygame.sprite.Sprite, GameObjectBase):
                  off_screen_ttl=0
     ):
         pygame.sprite.Sprite.__init__(self)
-        GameObjectBase.__init__(self)
-
-        self.image_asset = image_asset
-        self.image = self.image_asset.surface if self.image_asset else None
-        self.rect = self.image.get_rect() if self.image_asset else None
+        GameObjectCore.__init__(
+            self,
+            image_asset,
+            is_collidable=is_collidable,
+            visible=visible,
+            heading=heading,
+            death_effect=death_effect,
+            damage=damage,
+            kill_when_off_screen=kill_when_off_screen,
+            off_screen_ttl=off_screen_ttl
+        )
         self.scale = scale
-        self.__pos = pygame.math.Vector2(0.0, 0.0)
-        self.__heading = normalize_angle(round(heading))
-        self._dirty_image = True
-        self.is_collidable = is_collidable
-        if self.is_collidable:
-            self.mask = pygame.mask.from_surface(self.image, 16)
-        else:
-            self.mask = None
-        self.parent = None
-        self.health = 100
-        self.attachments = []
         self.__alpha = alpha
-        self.visible = visible
-        self.death_effect = death_effect
-        self.damage = damage
-        self.kill_when_off_screen = kill_when_off_screen
-        self.__off_screen_warning = False
-        self.__off_screen_ms = 0
-        self.__off_screen_ttl = off_screen_ttl
+        self.attachments = []
+        # Position and heading that the attachments were last placed for, and that the world transform was made for
+        self.__placed_for = None
+        self.__world_transform_for = None
+        self.__world_transform = None
+        self.__initial_look = (scale, alpha)
+
+    def recycle(self, heading=None, scale=None, alpha=None, visible=None):
+        """
+        Resets the game object to the state it was created in, so that GameObjectFactory can hand it out again instead
+        of creating a new object. The arguments override the initial values, like the kwargs passed to create do.
+
+        Game types are only pooled if their class defines recycle itself, since an inherited recycle can't reset the
+        state that the class adds. Overrides reset that state and pass their kwargs on to the recycle of their base.
+        create calls that pass kwargs that recycle doesn't take get a new object instead of a recycled one.
+        """
+        super().recycle(heading=heading, visible=visible)
+        initial_scale, initial_alpha = self.__initial_look
+        self.scale = initial_scale if scale is None else scale
+        self.__alpha = initial_alpha if alpha is None else alpha
+        self.__placed_for = None
+
+    def kill(self):
+        """Removes the game object from all its groups, and returns it to its pool if it has one."""
+        pygame.sprite.Sprite.kill(self)
+        self._return_to_pool()
 
     def get_replicated_props(self):
         """Returns a list of properties that this object will replicate from server to connected clients."""
@@ -60,76 +72,65 @@ class GameObject(pygame.sprite.Sprite, GameObjectBase):
 
     def update(self, delta):
         """Updates the game object. Delta time is in ms."""
-        super().update()
-
-        if self.__off_screen_warning:
-            self.__off_screen_ms -= delta
-            if self.__off_screen_ms <= 0:
-                # If an object is off the screen for its maximum allowed time to be off the screen (off_screen_ms),
-                # then it and its attachments get killed, regardless of whether the attachments are off the screen.
-                self.__kill_myself()
-                return
-
-        self.transform()
+        super().update(delta)
+        # Game objects that were killed because they stayed off the screen have no attachments left
+        if self.attachments:
+            self.place_attachments()
+
+    def place_attachments(self):
+        """
+        Moves the attachments that take the parent transform, and their own attachments in turn, to follow the game
+        object. The world transform is only made again when the game object moves or turns, and attachments that are
+        still where they were last placed aren't placed again, so attachments of static game objects cost little.
+        Attachments that moved or turned by themselves are snapped back.
+        """
+        position = self.position
+        heading = self.heading
+        placed_for = (position.x, position.y, heading)
+        moved = placed_for != self.__placed_for
+        self.__placed_for = placed_for
         for attachment in self.attachments:
             if attachment.parent_transform:
-                t = Transform(self.position, self.heading)
-
-                attachment_pos = t.apply(attachment.offset)
-                attachment.game_object.position = attachment_pos
-                attachment.game_object.heading = self.heading
-
-    def transform(self):
-        """Transforms the object based on current heading, scale, and position."""
-        # Rotate and scale if necessary
-        if self._dirty_image:
-            self.image = self.image_asset.get_surface(self.__heading, self.scale)
-            if self.__alpha != 1.0:
-                self.image.set_alpha(self.__alpha * 255)
-            self.rect = self.image.get_rect()
-            if self.is_collidable:
-                self.mask = pygame.mask.from_surface(self.image, 16)
-            self._dirty_image = False
-
-        # Translate
-        topleft = self.position - pygame.math.Vector2(self.rect.width / 2.0, self.rect.height / 2.0)
-        self.rect.topleft = pygame.Vector2(round(topleft.x), round(topleft.y))
+                gob = attachment.game_object
+                if (
+                    moved
+                    or gob.position != attachment.placed_position
+                    or (attachment.inherit_heading and gob.heading != heading)
+                ):
+                    gob.position = self.world_transform.apply(attachment.offset)
+                    attachment.placed_position = (gob.position.x, gob.position.y)
+                    if attachment.inherit_heading:
+                        gob.heading = heading
+                    if gob.attachments:
+                        gob.place_attachments()
+
+    @property
+    def world_transform(self) -> Transform:
+        """The transform from the game object's space to world space, cached until the game object moves or turns."""
+        position = self.position
+        transform_for = (position.x, position.y, self.heading)
+        if transform_for != self.__world_transform_for:
+            self.__world_transform_for = transform_for
+            self.__world_transform = Transform(position, self.heading)
+        return self.__world_transform
+
+    def _render_image(self):
+        """Sets the image, rect and mask for the current heading, scale and alpha."""
+        self.image = self.image_asset.get_surface(self.heading, self.scale, alpha = self.__alpha)
+        self.rect = self.image.get_rect()
+        if self.is_collidable:
+            self.mask = self.image_asset.get_mask(self.heading, self.scale)
 
     def set_scale(self, scale):
         """Sets the scale of the sprite."""
         self._dirty_image = self._dirty_image or self.scale != scale
         self.scale = scale
 
-    @property
-    def position(self):
-        """Retrieves the gob's position."""
-        return self.__pos
-
-    @position.setter
-    def position(self, pos):
-        """Sets the position of the sprite in the screen so that the sprite's center is at pos."""
-        self.__pos = pygame.math.Vector2(pos[0], pos[1])
-
     @property
     def position_tuple(self):
         """Retrieves the gob's position."""
-        return (self.__pos.x, self.__pos.y)
-
-    @property
-    def heading(self):
-        return self.__heading
-
-    @heading.setter
-    def heading(self, h):
-        """Sets the orientation of the game object."""
-        self._dirty_image = self._dirty_image or self.__heading != h
-        self.__heading = normalize_angle(round(h))
-
-    def set_image(self, image_asset):
-        """Sets a new image for the game object."""
-        self.image_asset = image_asset
-        self.image = self.image_asset.surface
-        self._dirty_image = True
+        position = self.position
+        return (position.x, position.y)
 
     @property
     def alpha(self) -> float:
@@ -140,90 +141,34 @@ class GameObject(pygame.sprite.Sprite, GameObjectBase):
         self._dirty_image = self._dirty_image or self.__alpha != a
         self.__alpha = a
 
-    def attach(self, game_object, offset, take_parent_transform):
-        """Attaches a game object to this game object at the given offset."""
-        self.attachments.append(Attachment(game_object, offset, take_parent_transform))
+    def attach(self, game_object, offset, take_parent_transform, inherit_heading=True):
+        """
+        Attaches a game object to this game object at the given offset. If take_parent_transform is True, the attachment
+        follows this game object at the offset rotated by its heading, and takes its heading too unless inherit_heading
+        is False. Otherwise the attachment places itself.
+        """
+        self.attachments.append(Attachment(game_object, offset, take_parent_transform, inherit_heading))
         game_object.set_parent(self)
-
-    def handle_collision(self, gob, world_pos):
-        """Reacts to collision against game object gob."""
-        # Apply damage to the collided sprite
-        instigator = GameObject.get_root_parent(self)
-        gob.take_damage(self.damage, instigator)
-
-    def take_damage(self, damage, instigator):
-        """Takes damage for this game object."""
-        self.health -= damage
-        if self.health <= 0:
-            self.health = 0
-            self.die(instigator)
-
-    def die(self, instigator):
-        """Die."""
-        if self.alive() and self.death_effect:
-            effect = self.death_effect.create()
-            effect.position = self.position
-            effect.play(self.death_effect_callback)
-
-        # Kill off attachments
-        for attachment in self.attachments:
-            attachment.game_object.take_damage(attachment.game_object.health, instigator)
-
-        self.kill()
+        # Place the new attachment on the next update even if this game object doesn't move
+        self.__placed_for = None
 
     def add_to_groups(self, groups):
         """Adds the game object to the given sprite groups."""
         self.add(groups)
 
-    def set_layer_id(self, layer_id):
-        """Sets the layer for rendering."""
-        self._layer = layer_id
-
-    def set_parent(self, parent):
-        """Sets this game object's parent."""
-        self.parent = parent
-
-    def death_effect_callback(self):
-        """Callback for when the death effect is done playing."""
-        pass
-
-    @property
-    def off_screen_warning(self) -> bool:
-        return self.__off_screen_warning
-
-    @off_screen_warning.setter
-    def off_screen_warning(self, value: bool):
-        self.__off_screen_warning = value
-        if value:
-            self.__off_screen_ms = self.__off_screen_ttl
-
-    @property
-    def off_screen_ms(self) -> int:
-        return self.__off_screen_ms
-
-    @property
-    def blit_surfaces(self) -> list[BlitSurface]:
-        return [BlitSurface(self.image, self.rect)]
-
-    def __kill_myself(self):
-        """Recursively kills this GameObject and its attachments."""
-        for attachment in self.attachments:
-            attachment.game_object.__kill_myself()
-        self.attachments.clear()
-        self.kill()
-
     @classmethod
     def get_root_parent(cls, gob):
-        """Recurses up parent-child relationships to find the root parent."""
-        root = gob
-        while not root.parent is None:
-            root = gob.parent
-        return root
+        """Returns the root parent of gob. See root_parent."""
+        return gob.root_parent
 
 
 class Attachment():
 
-    def __init__(self, game_object, offset, parent_transform):
+    def __init__(self, game_object, offset, parent_transform, inherit_heading=True):
         self.game_object = game_object
         self.offset = offset
         self.parent_transform = parent_transform
+        self.inherit_heading = inherit_heading
+        # Where the parent last placed the game object as an (x, y) tuple, to tell whether it moved since. A copy,
+        # since the game object's position can be changed in place.
+        self.placed_position = None
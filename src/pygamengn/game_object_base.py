@@ -4,6 +4,9 @@ from abc import ABCMeta
 class GameObjectBase(metaclass=ABCMeta):
     """Base class for GameObject."""
 
+    # Subclasses without a __dict__, like Entity, need the object id in a slot
+    __slots__ = ("__object_id",)
+
     __next_object_id = 0
 
     def __init__(self):
@@ -0,0 +1,289 @@
+import pygame
+
+from pygamengn.blit_surface import BlitSurface
+from pygamengn.game_object_base import GameObjectBase
+from pygamengn.geometry import normalize_angle
+
+
+class GameObjectCore(GameObjectBase):
+    """
+    State and behaviour that GameObject and Entity share: the image, position and heading, parents, damage and death,
+    the time allowed off the screen, and pooling.
+
+    The state lives in __slots__, so that Entity, which has no __dict__, can keep it. Classes that add state of their
+    own either declare __slots__ too (like Entity) or have a __dict__ for it (like GameObject, through pygame's Sprite).
+    """
+
+    __slots__ = (
+        "image_asset",
+        "image",
+        "rect",
+        "mask",
+        "is_collidable",
+        "visible",
+        "mover",
+        "health",
+        "damage",
+        "death_effect",
+        "kill_when_off_screen",
+        "_layer",
+        "_dirty_image",
+        "__pos",
+        "__heading",
+        "__image_revision",
+        "__parent",
+        "__root",
+        "__root_revision",
+        "__child_count",
+        "__off_screen_warning",
+        "__off_screen_ms",
+        "__off_screen_ttl",
+        "__initial_state",
+        "__pool",
+        "__pooled",
+    )
+
+    # Bumped when a game object with children of its own changes parent, which makes every cached root parent stale.
+    # Game objects without children only update their own cached root.
+    __parents_revision = 0
+
+    # Classes that support attachments replace these with a list of Attachments. Code that walks the attachments of
+    # game objects, like die, can walk these too.
+    attachments = ()
+
+    def __init__(self,
+                 image_asset,
+                 is_collidable=True,
+                 visible=True,
+                 heading=0,
+                 health=100,
+                 death_effect=None,
+                 damage=0,
+                 kill_when_off_screen=False,
+                 off_screen_ttl=0
+    ):
+        GameObjectBase.__init__(self)
+        self.image_asset = image_asset
+        self.image = image_asset.surface if image_asset else None
+        self.rect = self.image.get_rect() if image_asset else None
+        self.mask = image_asset.get_mask() if is_collidable else None
+        self.is_collidable = is_collidable
+        self.visible = visible
+        # Subclasses that move set their Mover here
+        self.mover = None
+        self.health = health
+        self.damage = damage
+        self.death_effect = death_effect
+        self.kill_when_off_screen = kill_when_off_screen
+        self._dirty_image = True
+        self.__pos = pygame.math.Vector2(0.0, 0.0)
+        self.__heading = normalize_angle(round(heading))
+        self.__image_revision = image_asset.revision if image_asset else 0
+        self.__parent = None
+        self.__root = self
+        self.__root_revision = GameObjectCore.__parents_revision
+        self.__child_count = 0
+        self.__off_screen_warning = False
+        self.__off_screen_ms = 0
+        self.__off_screen_ttl = off_screen_ttl
+        self.__initial_state = (heading, health, visible)
+        self.__pool = None
+        self.__pooled = False
+
+    def recycle(self, heading=None, visible=None):
+        """
+        Resets the state that GameObjectCore keeps to the state it was created in. The arguments override the initial
+        values, like the kwargs passed to GameObjectFactory.create do. See GameObject.recycle.
+        """
+        GameObjectBase.__init__(self)
+        if self.image_asset:
+            self.image = self.image_asset.surface
+            self.rect = self.image.get_rect()
+        initial_heading, initial_health, initial_visible = self.__initial_state
+        self.visible = initial_visible if visible is None else visible
+        self.health = initial_health
+        self._dirty_image = True
+        self.__pos = pygame.math.Vector2(0.0, 0.0)
+        self.__heading = normalize_angle(round(initial_heading if heading is None else heading))
+        if self.__parent is not None:
+            self.__parent.__child_count -= 1
+            self.__parent = None
+        if self.__child_count:
+            GameObjectCore.__parents_revision += 1
+        self.__root = self
+        self.__root_revision = GameObjectCore.__parents_revision
+        self.__off_screen_warning = False
+        self.__off_screen_ms = 0
+        self.__pooled = False
+
+    def set_pool(self, pool):
+        """Sets the ObjectPool that the game object returns to when it's killed."""
+        self.__pool = pool
+
+    def _return_to_pool(self):
+        """Returns the game object to its pool, if it has one, once it's killed."""
+        if self.__pool is not None and not self.__pooled:
+            self.__pooled = True
+            self.__pool.release(self)
+
+    def set_layer_id(self, layer_id):
+        """Sets the layer for rendering."""
+        self._layer = layer_id
+
+    def update(self, delta):
+        """Updates the game object. Delta time is in ms."""
+        if self.__off_screen_warning:
+            self.__off_screen_ms -= delta
+            if self.__off_screen_ms <= 0:
+                # If an object is off the screen for its maximum allowed time to be off the screen (off_screen_ms),
+                # then it and its attachments get killed, regardless of whether the attachments are off the screen.
+                self.__kill_myself()
+                return
+
+        self.transform()
+
+    def transform(self):
+        """Renders the image again if the heading or the image changed, and centers the rect on the position."""
+        # Fetch the image again if a streamed image asset finished loading since the last time
+        if self.image_asset and self.image_asset.revision != self.__image_revision:
+            self.__image_revision = self.image_asset.revision
+            self._dirty_image = True
+
+        if self._dirty_image:
+            self._render_image()
+            self._dirty_image = False
+
+        position = self.position
+        self.rect.topleft = (round(position.x - self.rect.width / 2.0), round(position.y - self.rect.height / 2.0))
+
+    def _render_image(self):
+        """Sets the image, rect and mask for the current heading. Subclasses with other looks override it."""
+        self.image = self.image_asset.get_surface(self.__heading)
+        self.rect = self.image.get_rect()
+        if self.is_collidable:
+            self.mask = self.image_asset.get_mask(self.__heading)
+
+    def set_image(self, image_asset):
+        """Sets a new image for the game object."""
+        self.image_asset = image_asset
+        self.image = self.image_asset.surface
+        self.__image_revision = self.image_asset.revision
+        self._dirty_image = True
+
+    @property
+    def position(self):
+        """Retrieves the gob's position."""
+        return self.__pos
+
+    @position.setter
+    def position(self, pos):
+        """Sets the position of the sprite in the screen so that the sprite's center is at pos."""
+        self.__pos = pygame.math.Vector2(pos[0], pos[1])
+
+    @property
+    def heading(self):
+        return self.__heading
+
+    @heading.setter
+    def heading(self, h):
+        """Sets the orientation of the game object."""
+        h = normalize_angle(round(h))
+        self._dirty_image = self._dirty_image or self.__rotation_frame(self.__heading) != self.__rotation_frame(h)
+        self.__heading = h
+
+    def set_parent(self, parent):
+        """Sets this game object's parent."""
+        self.parent = parent
+
+    @property
+    def parent(self):
+        return self.__parent
+
+    @parent.setter
+    def parent(self, parent):
+        if parent is self.__parent:
+            return
+        if self.__parent is not None:
+            self.__parent.__child_count -= 1
+        if parent is not None:
+            parent.__child_count += 1
+        self.__parent = parent
+        if self.__child_count:
+            # The roots of the whole subtree under this game object changed
+            GameObjectCore.__parents_revision += 1
+        self.__root = parent.root_parent if parent is not None else self
+        self.__root_revision = GameObjectCore.__parents_revision
+
+    @property
+    def root_parent(self):
+        """
+        The game object at the top of this game object's chain of parents, or the game object itself if it has no parent.
+        The root is cached until the parent of this game object, or of one with children above it, changes.
+        """
+        if self.__root_revision != GameObjectCore.__parents_revision:
+            root = self
+            while root.parent is not None:
+                root = root.parent
+            self.__root = root
+            self.__root_revision = GameObjectCore.__parents_revision
+        return self.__root
+
+    def handle_collision(self, gob, world_pos):
+        """Reacts to collision against game object gob."""
+        # Apply damage to the collided sprite
+        instigator = self.root_parent
+        gob.take_damage(self.damage, instigator)
+
+    def take_damage(self, damage, instigator):
+        """Takes damage for this game object."""
+        self.health -= damage
+        if self.health <= 0:
+            self.health = 0
+            self.die(instigator)
+
+    def die(self, instigator):
+        """Plays the death effect, if any, and kills the game object and its attachments."""
+        if self.alive() and self.death_effect:
+            effect = self.death_effect.create()
+            effect.position = self.position
+            effect.play(self.death_effect_callback)
+
+        # Kill off attachments
+        for attachment in self.attachments:
+            attachment.game_object.take_damage(attachment.game_object.health, instigator)
+
+        self.kill()
+
+    def death_effect_callback(self):
+        """Callback for when the death effect is done playing."""
+        pass
+
+    @property
+    def off_screen_warning(self) -> bool:
+        return self.__off_screen_warning
+
+    @off_screen_warning.setter
+    def off_screen_warning(self, value: bool):
+        self.__off_screen_warning = value
+        if value:
+            self.__off_screen_ms = self.__off_screen_ttl
+
+    @property
+    def off_screen_ms(self) -> int:
+        return self.__off_screen_ms
+
+    @property
+    def blit_surfaces(self) -> list[BlitSurface]:
+        return [BlitSurface(self.image, self.rect)]
+
+    def __kill_myself(self):
+        """Recursively kills this game object and its attachments."""
+        for attachment in self.attachments:
+            attachment.game_object.__kill_myself()
+        if self.attachments:
+            self.attachments.clear()
+        self.kill()
+
+    def __rotation_frame(self, heading: int) -> int:
+        """Returns the image asset's rotation frame for heading, so that headings within one frame don't redraw."""
+        return self.image_asset.rotation_frame(heading) if self.image_asset else heading
@@ -1,12 +1,30 @@
+from __future__ import annotations
+
 import asyncio
-import copy
+import inspect
 import logging
 import os
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
 
 import pygame
 
+from pygamengn.game_object import GameObject
 from pygamengn.game_object_base import GameObjectBase
+from pygamengn.game_object_core import GameObjectCore
 from pygamengn.image_asset import ImageAsset
+from pygamengn.inventory import (
+    BASE_TYPES_KEY,
+    base_type_chain,
+    derive_type,
+    reachable_entries,
+    reference_graph,
+    resolve_scopes
+)
+from pygamengn.object_pool import ObjectPool
+from pygamengn.rotation_renderer import RotationRenderer
+from pygamengn.startup_tracer import StartupTracer
 
 
 class GameObjectFactory():
@@ -18,12 +36,69 @@ class GameObjectFactory():
         def __init__(self, message):
             super().__init__(message)
 
+    # Special keys whose references are resolved every time an object is created, rather than once per game type
+    __DYNAMIC_KEYS = ("game_object:", "type_spec:")
+
     def __init__(self, registry):
-        self.layer_manager = None
+        self.__layer_manager = None
         self.replication_manager = None
         self.registry = registry
+        self.__streaming_task = None
+        self.__plans = {}
+
+    @property
+    def layer_manager(self):
+        return self.__layer_manager
+
+    @layer_manager.setter
+    def layer_manager(self, layer_manager):
+        # Creation plans have layer ids baked in
+        self.__layer_manager = layer_manager
+        self.__plans.clear()
+
+    async def load(
+        self,
+        assets_dir,
+        images,
+        sounds,
+        assets,
+        game_types,
+        cache_dir = None,
+        workers = 0,
+        progress = None,
+        stream = False,
+        priority = (),
+        resolved = False,
+        roots = None,
+        rotation_workers = 0
+    ):
+        """
+        Loads the inventory. If cache_dir is given, ImageAssets persist their rotation caches there so that they don't
+        need to render them again the next time the game runs.
+
+        If workers is greater than 0, images and sounds are decoded by that many threads while the event loop keeps
+        running. pygame releases the GIL while it decodes and transforms, so loading takes less time on machines with
+        several cores. Platforms without threads (e.g., the browser) always load on the event loop's thread.
+
+        If progress is given, it's called with the number of images, sounds and assets loaded so far and their total
+        every time one of them finishes loading.
+
+        If stream is True, load returns as soon as the images named in priority and the images referenced by assets are
+        loaded, and the rest of the images load in the background while the game runs. Until then, they're placeholders
+        that game objects swap for the real images once they arrive (see ImageAsset). Sounds are small enough that they
+        always load before load returns.
+
+        If resolved is True, the inventory was compiled with pygamengn.inventory.compile_inventory, so its scopes and
+        base types are already resolved.
+
+        If rotation_workers is greater than 0, the rotation frames of the images that cache them up front, and that
+        aren't in the rotation cache yet, render in that many worker processes (see RotationRenderer). Rendering them
+        is bound by the CPU, so the first start of the game takes less time on machines with several cores.
 
-    async def load(self, assets_dir, images, sounds, assets, game_types):
+        If roots is given, only the images, sounds and assets that can be reached from them load (see
+        pygamengn.inventory.reference_graph). roots are the names of the entries that the game code uses directly, like
+        "game_object:/Game" or "image:icon".
+        """
         # Keys that get special treatment
         self.special_keys = [
             ("image:", lambda name: self.images[name]),
@@ -35,68 +110,266 @@ class GameObjectFactory():
         ]
 
         # Initialize game types
-        self.game_types = self.__init_game_types(game_types)
+        with StartupTracer.span("Game types"):
+            self.game_types = game_types if resolved else resolve_scopes(game_types)
+            if roots is not None:
+                images, sounds, assets = self.__prune(images, sounds, assets, roots)
+            # Entries with the same file and kwargs share one ImageAsset
+            images, image_aliases = self.__intern_images(images)
+        self.__plans.clear()
         await asyncio.sleep(0)
 
-        # Load images and sounds, and initialize assets
-        self.images = self.__create_assets(images, lambda v: self.__create_image_asset(assets_dir, v))
-        await asyncio.sleep(0)
-        self.sounds = self.__create_assets(sounds, lambda v: pygame.mixer.Sound(os.path.join(assets_dir, v)))
-        await asyncio.sleep(0)
-        self.assets = self.__create_assets(assets, lambda v: self.__create_object(v))
-        await asyncio.sleep(0)
+        loaded = 0
+        total = len(images) + len(sounds) + len(assets)
+        def on_loaded():
+            nonlocal loaded
+            loaded += 1
+            if progress:
+                progress(loaded, total)
+
+        # Load images and sounds, and initialize assets, which may refer to images and sounds
+        executor = ThreadPoolExecutor(workers) if workers > 0 and sys.platform != "emscripten" else None
+        rotation_renderer = (
+            RotationRenderer.process_pool(rotation_workers)
+            if rotation_workers > 0 and sys.platform != "emscripten" else None
+        )
+        try:
+            with StartupTracer.span("Images and sounds"):
+                if stream:
+                    self.images = {
+                        k: self.__create_image_asset(assets_dir, v, cache_dir, rotation_renderer, True)
+                        for k, v in images.items()
+                    }
+                    priority_images = {
+                        image_aliases[name]: self.images[image_aliases[name]]
+                        for name in list(priority) + self.__referenced_images(assets)
+                    }
+                    images_loaded = self.__load_assets(
+                        priority_images, lambda image: image.load(), executor, on_loaded, "image"
+                    )
+                else:
+                    images_loaded = self.__load_assets(
+                        images,
+                        lambda v: self.__create_image_asset(assets_dir, v, cache_dir, rotation_renderer),
+                        executor,
+                        on_loaded,
+                        "image"
+                    )
+                loaded_images, self.sounds = await asyncio.gather(
+                    images_loaded,
+                    self.__load_assets(
+                        sounds, lambda v: pygame.mixer.Sound(os.path.join(assets_dir, v)), executor, on_loaded, "sound"
+                    )
+                )
+                if not stream:
+                    self.images = loaded_images
+                self.images = {name: self.images[alias] for name, alias in image_aliases.items()}
+        finally:
+            if executor:
+                executor.shutdown()
+            # Streamed images keep rendering until they're all loaded
+            if rotation_renderer and not stream:
+                rotation_renderer.shutdown()
+        with StartupTracer.span("Assets"):
+            self.assets = await self.__load_assets(
+                assets, lambda v: self.__create_object(v), None, on_loaded, "asset"
+            )
+
+        if stream:
+            streamed_images = {
+                name: image for name, image in self.images.items() if image_aliases[name] == name and not image.loaded
+            }
+            self.__streaming_task = asyncio.create_task(
+                self.__stream_images(streamed_images, workers, rotation_renderer, on_loaded)
+            )
+
+    def __prune(self, images, sounds, assets, roots):
+        """Returns the images, sounds and assets that can be reached from roots, leaving out the rest."""
+        reachable = reachable_entries(reference_graph(images, sounds, assets, self.game_types), roots)
+        pruned = tuple(
+            {name: entry for name, entry in dictionary.items() if f"{kind}:{name}" in reachable}
+            for kind, dictionary in (("image", images), ("sound", sounds), ("asset", assets))
+        )
+        skipped = len(images) + len(sounds) + len(assets) - sum(len(dictionary) for dictionary in pruned)
+        if skipped:
+            logging.info(f"Skipping {skipped} unreachable images, sounds and assets")
+        return pruned
+
+    def __intern_images(self, images):
+        """
+        Returns the images with a distinct class and kwargs, and the name of the image in them to use for each of the
+        given images. Identical images then share one decoded surface and one set of rotation frames.
+        """
+        unique_images = {}
+        aliases = {}
+        names = {}
+        for name, image in images.items():
+            kwargs = dict(image["kwargs"])
+            kwargs["fname"] = os.path.normpath(kwargs["fname"])
+            key = (image["class_name"], repr(sorted(kwargs.items())))
+            alias = names.setdefault(key, name)
+            if alias == name:
+                unique_images[name] = image
+            aliases[name] = alias
+        if len(unique_images) < len(images):
+            logging.info(f"Sharing {len(unique_images)} images between {len(images)} inventory entries")
+        return unique_images, aliases
+
+    @property
+    def streaming(self) -> bool:
+        """Whether images are still loading in the background."""
+        return self.__streaming_task is not None and not self.__streaming_task.done()
 
     def create(self, name: str, **kwargs) -> GameObjectBase:
-        """Creates a GameObject instance."""
-        game_type = self.__get_game_type(name)
+        """
+        Creates a GameObject instance. The game type is compiled into a TypePlan the first time an instance of it is
+        created, so that later calls only need to run the plan. Game types with a pool recycle killed instances when
+        they can (see ObjectPool).
+        """
+        plan = self.__get_plan(name)
+        gob = self.__spawn(plan, name, kwargs)
 
-        logging.debug(f"Creating {name}")
+        # Add to groups as specified in type spec
+        if plan.groups:
+            if plan.layer_id is not None:
+                gob.set_layer_id(plan.layer_id)
+            gob.add_to_groups(plan.groups)
 
-        base_type = game_type.get("base_type")
-        if base_type:
-            game_type = self.__build_derived_type(self.__get_game_type(base_type), game_type)
+        self.__create_attachments(plan, gob)
+        return gob
 
-        gob = self.__create_object(game_type, **kwargs)
+    def create_many(self, name: str, count: int, positions = None, headings = None, **kwargs) -> list[GameObjectBase]:
+        """
+        Creates count GameObject instances of the same game type, looking up the game type's plan only once and adding
+        all of them to each of their groups at once. If given, positions and headings are sequences with one value for
+        each instance. Instances with a position are transformed, so that their rects are in place right away.
+        """
+        plan = self.__get_plan(name)
+        gobs = []
+        for i in range(count):
+            gob = self.__spawn(plan, name, kwargs if headings is None else dict(kwargs, heading = headings[i]))
+            if positions is not None:
+                gob.position = positions[i]
+                gob.transform()
+            if plan.groups and plan.layer_id is not None:
+                gob.set_layer_id(plan.layer_id)
+            gobs.append(gob)
+
+        if plan.groups:
+            if plan.bulk_add:
+                for group in plan.groups:
+                    group.add(*gobs)
+            else:
+                # Classes like Entity know a quicker way to join a group than Group.add
+                for gob in gobs:
+                    gob.add_to_groups(plan.groups)
+
+        for gob in gobs:
+            self.__create_attachments(plan, gob)
+        return gobs
+
+    def __get_plan(self, name: str) -> TypePlan:
+        """Returns the TypePlan for the given game type, compiling it if necessary."""
+        plan = self.__plans.get(name)
+        if plan is None:
+            plan = self.__compile_game_type(name)
+        return plan
+
+    def __spawn(self, plan: TypePlan, name: str, kwargs: dict) -> GameObjectBase:
+        """Recycles or creates an instance from plan, and sets up its replication. Doesn't add it to groups."""
+        logging.debug("Creating %s", name)
+
+        gob = None
+        if plan.pool is not None and kwargs.keys() <= plan.recycle_kwargs:
+            # Objects can only be recycled with the kwargs that recycle takes; other kwargs need a new object
+            gob = plan.pool.acquire()
+        if gob:
+            gob.recycle(**kwargs)
+        else:
+            gob = self.__instantiate(plan, kwargs)
+            if plan.pool is not None:
+                gob.set_pool(plan.pool)
 
         # Set up replication for this object if it wants it
-        is_replicated = game_type.get("is_replicated")
-        if is_replicated:
+        if plan.is_replicated:
             self.replication_manager.add_object(name, gob)
 
-        # Add to groups as specified in type spec
-        group_names = game_type.get("groups")
-        if group_names:
-            if isinstance(gob, pygame.sprite.Sprite) and self.layer_manager:
-                self.layer_manager.set_layer_id(gob, name, game_type["class_name"])
-
-            groups = [self.assets[name] for name in group_names]
-            gob.add_to_groups(groups)
+        return gob
 
-        # Create attachments
-        attachment_specs = game_type.get("attachments")
-        if gob and attachment_specs:
-            for attachment_spec in attachment_specs:
-                attachment_object = self.create(attachment_spec["game_type"])
+    def __create_attachments(self, plan: TypePlan, gob: GameObjectBase):
+        """Creates the attachments in plan and attaches them to gob."""
+        if gob and plan.attachments:
+            for game_type, offset, parent_transform, inherit_heading in plan.attachments:
+                attachment_object = self.create(game_type)
                 if attachment_object:
-                    parent_transform = attachment_spec.get("parent_transform")
-                    if parent_transform == None:
-                        parent_transform = True
-                    gob.attach(attachment_object, attachment_spec["offset"], parent_transform)
+                    gob.attach(attachment_object, offset, parent_transform, inherit_heading)
                     gob.transform()
 
-        return gob
+    def __compile_game_type(self, name: str) -> TypePlan:
+        """Compiles the given game type into a TypePlan and caches it."""
+        game_type = self.__get_game_type(name)
+
+        base_types = base_type_chain(self.game_types, game_type)
+        if base_types and BASE_TYPES_KEY not in game_type:
+            game_type = derive_type(self.__get_game_type(base_types[0]), game_type)
 
-    def __build_derived_type(self, parent_type, child_type):
-        """Builds a dictionary for a game type by merging the name's dictionary with its base type's."""
-        merged_type = copy.deepcopy(parent_type)
-        for child_key in child_type:
-            if child_key != "base_type":
-                self.__recursive_copy(child_type, merged_type, child_key)
-        return merged_type
+        plan = self.__compile_type_spec(game_type)
+        plan.is_replicated = bool(game_type.get("is_replicated"))
+
+        group_names = game_type.get("groups")
+        if group_names:
+            plan.groups = [self.assets[group_name] for group_name in group_names]
+            # Sprites that join groups like GameObject does can join them all at once in create_many
+            plan.bulk_add = (
+                issubclass(plan.gob_class, pygame.sprite.Sprite)
+                and getattr(plan.gob_class, "add_to_groups", None) is GameObject.add_to_groups
+            )
+            if issubclass(plan.gob_class, (pygame.sprite.Sprite, GameObjectCore)) and self.layer_manager:
+                layer_id = self.layer_manager.resolve_layer_id(name, game_type["class_name"], base_types)
+                if layer_id != self.layer_manager.INVALID_LAYER_ID:
+                    plan.layer_id = layer_id
+
+        for attachment_spec in game_type.get("attachments") or []:
+            parent_transform = attachment_spec.get("parent_transform")
+            if parent_transform == None:
+                parent_transform = True
+            inherit_heading = attachment_spec.get("inherit_heading", True)
+            plan.attachments.append(
+                (attachment_spec["game_type"], attachment_spec["offset"], parent_transform, inherit_heading)
+            )
+
+        pool_spec = game_type.get("pool")
+        if pool_spec:
+            # Only classes that define recycle themselves reset all of their state, rather than just their base's
+            if plan.attachments or plan.is_replicated or "recycle" not in vars(plan.gob_class):
+                logging.warn(
+                    f"Game type '{name}' can't be pooled because it has attachments, is replicated, or its class "
+                    f"doesn't define recycle"
+                )
+            else:
+                plan.pool = ObjectPool(pool_spec["size"])
+                plan.recycle_kwargs = _recycle_kwargs(plan.gob_class)
+
+        self.__plans[name] = plan
+        return plan
 
     def __create_object(self, type_spec, **kwargs) -> GameObjectBase:
         """Creates and returns a GameObjectBase instance from the given type specification."""
-        resolved_refs = {}
+        return self.__instantiate(self.__compile_type_spec(type_spec), kwargs)
+
+    def __compile_type_spec(self, type_spec) -> TypePlan:
+        """
+        Compiles the class and kwargs of the given type specification into a TypePlan. References to images, sounds,
+        assets and fonts are resolved right away, while references to game objects and type specs are kept for
+        __instantiate to resolve, since every instance gets objects of its own.
+        """
+        try:
+            gob_class = self.registry[type_spec["class_name"]]
+        except KeyError:
+            logging.critical(f"GameObjectBase subclass '{type_spec["class_name"]}' not found")
+            raise GameObjectFactory.UnknownGameType(f"Unknown game type: {type_spec["class_name"]}")
+
+        plan = TypePlan(gob_class)
         type_spec_kwargs = type_spec["kwargs"]
         for key in type_spec_kwargs:
             is_special_key = False
@@ -104,18 +377,29 @@ class GameObjectFactory():
             for special_key in self.special_keys:
                 if key.startswith(special_key[0]):
                     is_special_key = True
-                    self.__resolve_refs(key, type_spec_kwargs[key], special_key, resolved_refs)
+                    if special_key[0] in GameObjectFactory.__DYNAMIC_KEYS:
+                        plan.dynamic_kwargs.append((key, type_spec_kwargs[key], special_key))
+                    else:
+                        self.__resolve_refs(key, type_spec_kwargs[key], special_key, plan.kwargs)
 
             if not is_special_key:
-                resolved_refs[key] = type_spec_kwargs[key]
+                plan.kwargs[key] = type_spec_kwargs[key]
 
-        try:
-            gob_class = self.registry[type_spec["class_name"]]
-            gob = gob_class(**resolved_refs, **kwargs)
-            return gob
-        except KeyError:
-            logging.critical(f"GameObjectBase subclass '{type_spec["class_name"]}' not found")
-            raise GameObjectFactory.UnknownGameType(f"Unknown game type: {type_spec["class_name"]}")
+        # Instances get lists of their own, in case they modify them
+        plan.list_keys = [key for key, value in plan.kwargs.items() if isinstance(value, list)]
+        return plan
+
+    def __instantiate(self, plan: TypePlan, kwargs: dict) -> GameObjectBase:
+        """Creates an instance of the plan's class with the plan's kwargs and the given kwargs."""
+        if not plan.dynamic_kwargs and not plan.list_keys:
+            return plan.gob_class(**plan.kwargs, **kwargs)
+
+        resolved_refs = plan.kwargs.copy()
+        for key in plan.list_keys:
+            resolved_refs[key] = list(resolved_refs[key])
+        for key, value, special_key in plan.dynamic_kwargs:
+            self.__resolve_refs(key, value, special_key, resolved_refs)
+        return plan.gob_class(**resolved_refs, **kwargs)
 
     def __get_game_type(self, name: str) -> dict:
         """Gets the given game type, recursing into nested dictionaries as necessary."""
@@ -174,50 +458,115 @@ class GameObjectFactory():
                 asset_list.append([])
                 self.__assign_asset_list(asset_name, asset_list[-1], asset_retriever)
 
-    def __init_game_types(self, dictionary):
-        """Mutates dictionary to ensure all references to game objects have absolute scopes."""
+    async def __load_assets(self, dictionary, creator_func, executor, on_loaded, category):
+        """
+        Creates a dictionary of loaded and initialized assets using the creator_func, which runs in the executor if
+        there is one, or in the event loop's thread otherwise. Calls on_loaded every time an asset is created. The
+        creation of each asset is traced under the given category (see StartupTracer).
+        """
+        def create(key, value):
+            with StartupTracer.span(key, category):
+                return creator_func(value)
 
-        def recursive_dict_iterator(dictionary, scope=[""], parent_dict=None):
+        if not executor:
+            rv = {}
             for key, value in dictionary.items():
-                if type(value) is dict:
-                    scope.append(key)
-                    yield from recursive_dict_iterator(value, scope, value)
-                    scope.pop()
-                else:
-                    yield (key, value, scope, parent_dict)
-
-        for key, value, scope, parent_dict in recursive_dict_iterator(dictionary):
-            if key.startswith("game_object:"):
-                absolute_scope = scope[:-1]
-                if type(value) is list:
-                    parent_dict[key] = ["/".join(absolute_scope + [v]) if v[0] != '/' else v for v in value]
-                else:
-                    parent_dict[key] = "/".join(absolute_scope + [value]) if value[0] != '/' else value
-
-        return dictionary
-
-    def __create_assets(self, dictionary, creator_func):
-        """Creates a dictionary of loaded and initialized assets using the creator_func."""
-        rv = {}
-        for key, value in dictionary.items():
-            rv[key] = creator_func(value)
-        return rv
-
-    def __create_image_asset(self, assets_dir: str, d: dict) -> ImageAsset:
+                rv[key] = create(key, value)
+                on_loaded()
+                await asyncio.sleep(0)
+            return rv
+
+        loop = asyncio.get_running_loop()
+        futures = {key: loop.run_in_executor(executor, create, key, value) for key, value in dictionary.items()}
+        for future in futures.values():
+            future.add_done_callback(lambda _: on_loaded())
+        await asyncio.gather(*futures.values())
+        return {key: future.result() for key, future in futures.items()}
+
+    async def __stream_images(self, images, workers, rotation_renderer, on_loaded):
+        """Loads the given image assets in the background, one per event loop iteration unless there are workers."""
+        executor = ThreadPoolExecutor(workers) if workers > 0 and sys.platform != "emscripten" else None
+        try:
+            await self.__load_assets(images, lambda image: image.load(), executor, on_loaded, "image")
+        finally:
+            if executor:
+                executor.shutdown()
+            if rotation_renderer:
+                rotation_renderer.shutdown()
+
+    def __referenced_images(self, specs) -> list[str]:
+        """Returns the names of the images referenced by the "image:" kwargs in the given specs."""
+        names = []
+        def add_names(value):
+            if isinstance(value, str):
+                names.append(value)
+            elif isinstance(value, list):
+                for v in value:
+                    add_names(v)
+        for spec in specs.values():
+            for key, value in spec.get("kwargs", {}).items():
+                if key.startswith("image:"):
+                    add_names(value)
+        return names
+
+    def __create_image_asset(
+        self,
+        assets_dir: str,
+        d: dict,
+        cache_dir: str,
+        rotation_renderer: RotationRenderer = None,
+        stream: bool = False
+    ) -> ImageAsset:
         d["kwargs"]["fname"] = os.path.join(assets_dir, d["kwargs"]["fname"])
-        return self.__create_object(d)
-
-    def __recursive_copy(self, from_obj, to_obj, key):
-        """Recursively copies dictionary keys."""
-        if isinstance(from_obj[key], dict):
-            for subkey in from_obj[key]:
-                if not key in to_obj:
-                    to_obj[key] = {}
-                self.__recursive_copy(from_obj[key], to_obj[key], subkey)
-        elif isinstance(from_obj[key], list):
-            to_obj[key] = copy.deepcopy(from_obj[key])
-        else:
-            to_obj[key] = from_obj[key]
+        kwargs = {}
+        if cache_dir:
+            kwargs["cache_dir"] = cache_dir
+        if rotation_renderer:
+            kwargs["rotation_renderer"] = rotation_renderer
+        if stream:
+            kwargs["stream"] = True
+        return self.__create_object(d, **kwargs)
+
+
+class TypePlan:
+    """
+    Pre-resolved recipe that GameObjectFactory compiles from a game type to create its instances: the class to
+    instantiate, its kwargs, the groups and layer to add instances to, the attachments to create with them, and the pool
+    to recycle them from.
+    """
+
+    def __init__(self, gob_class):
+        self.gob_class = gob_class
+        self.kwargs = {}
+        self.dynamic_kwargs = []
+        self.list_keys = []
+        self.is_replicated = False
+        self.groups = []
+        self.bulk_add = False
+        self.layer_id = None
+        self.attachments = []
+        self.pool = None
+        self.recycle_kwargs = set()
+
+
+def _recycle_kwargs(gob_class) -> set[str]:
+    """
+    Returns the names of the kwargs that the recycle method of gob_class takes, following the overrides that pass
+    **kwargs on to the recycle method of their base class.
+    """
+    names = set()
+    for cls in gob_class.__mro__:
+        recycle = vars(cls).get("recycle")
+        if recycle is None:
+            continue
+        parameters = list(inspect.signature(recycle).parameters.values())[1:]
+        names.update(
+            parameter.name for parameter in parameters
+            if parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        )
+        if not any(parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in parameters):
+            break
+    return names
 
 
 class TypeSpec:
@@ -230,3 +579,12 @@ class TypeSpec:
     def create(self, **kwargs):
         """Creates an instance from the spec."""
         return self.__factory.create(self.__spec, **kwargs)
+
+    def create_many(self, count, positions=None, headings=None, **kwargs):
+        """Creates count instances from the spec. See GameObjectFactory.create_many."""
+        return self.__factory.create_many(self.__spec, count, positions, headings, **kwargs)
+
+    @property
+    def name(self):
+        """Name of the game type that the spec creates."""
+        return self.__spec
@@ -1,17 +1,73 @@
 from __future__ import annotations
 
 import logging
+import struct
+
+from enum import StrEnum, auto
 
 import pygame
 
 from pygamengn.class_registrar import ClassRegistrar
 from pygamengn.game_object_base import GameObjectBase
+from pygamengn.rotation_cache import RotationCache
+from pygamengn.rotation_renderer import RotationRenderer
+from pygamengn.startup_tracer import StartupTracer
+from pygamengn.surface_atlas import SurfaceAtlas
+from pygamengn.surface_cache import SurfaceCache
+
 
+class Symmetry(StrEnum):
+    """Symmetries of an image that let ImageAsset derive rotation frames from a subset of them."""
+    NONE = auto()
+    ROTATE_180 = auto()
+    ROTATE_90 = auto()
+    MIRROR_X = auto()
+    MIRROR_Y = auto()
 
 
 @ClassRegistrar.register("ImageAsset")
 class ImageAsset(GameObjectBase):
-    """Loadable image asset."""
+    """
+    Loadable image asset.
+
+    Rotated and scaled versions of the image can be cached in one of two ways:
+        1. cache_rotations renders all 360 rotations of every cached scale up front.
+        2. lazy_rotations renders each rotation and scale the first time get_surface asks for it, and keeps it in a
+           least-recently-used SurfaceCache. The cache is owned by the asset if cache_budget (in bytes) is greater
+           than 0, otherwise the asset uses the shared SurfaceCache.
+
+    Rotations are quantized to rotation_step degrees, or to rotation_frames evenly spaced frames if rotation_frames is
+    greater than 0. Small images look the same with far fewer than 360 frames, which makes their caches cheaper to
+    build and to keep in memory.
+
+    Images with a symmetry only rasterize the unique subset of their rotation frames. With ROTATE_180 and ROTATE_90 the
+    image looks the same after half and quarter turns, so the rest of the frames are the same surfaces. MIRROR_X and
+    MIRROR_Y declare an image that looks the same flipped along the x and y axes respectively, so the frames for
+    negative rotations are flipped copies of the ones for positive rotations.
+
+    Rotations cached up front are also persisted in a RotationCache if cache_dir is given, so they only need to be
+    rendered the first time the game runs, and again whenever the image file or the asset's kwargs change. They can
+    also be baked into the cache ahead of time with bake(). Given a rotation_renderer, the frames that load renders are
+    rendered by its workers instead of the calling thread (see RotationRenderer).
+
+    With pack_rotations, rotations cached up front are packed into the pages of the shared SurfaceAtlas, so the frames
+    of many assets live in a handful of large surfaces instead of one surface each.
+
+    Streamed assets don't load the image when they're created. Until load() is called, the asset hands out transparent
+    placeholders the size of the frames they stand in for, so game objects can be created with it right away, and their
+    rects don't change size when the image arrives.
+    The revision property changes every time the image is loaded, which tells the users of the asset to fetch its
+    surfaces again.
+
+    Collision masks are built the first time get_mask asks for them and cached next to the rotation frames, so game
+    objects that share an image also share its masks.
+
+    Translucent versions of the image are quantized to alpha_levels levels and kept in the asset's SurfaceCache. Each
+    one is a subsurface of the opaque frame with an alpha of its own, so game objects can fade without copying pixels
+    or changing the alpha of surfaces that other game objects are drawing.
+    """
+
+    MASK_THRESHOLD = 16
 
     def __init__(
         self,
@@ -20,24 +76,86 @@ class ImageAsset(GameObjectBase):
         alpha: float = 1.0,
         angle: int = 0,
         cache_rotations: bool = False,
+        lazy_rotations: bool = False,
+        cache_budget: int = 0,
+        rotation_step: float = 1.0,
+        rotation_frames: int = 0,
+        symmetry: Symmetry = Symmetry.NONE,
+        cache_dir: str = None,
+        alpha_levels: int = 32,
+        pack_rotations: bool = False,
+        stream: bool = False,
+        rotation_renderer: RotationRenderer = None,
         **kwargs
     ):
         super().__init__(**kwargs)
         self.__fname = fname
-        self.__base_surface = pygame.transform.rotozoom(pygame.image.load(self.__fname), angle, scale)
+        self.__scale = scale
+        self.__angle = angle
         self.__alpha = alpha
+        self.__rotation_frames = rotation_frames if rotation_frames > 0 else max(1, round(360 / rotation_step))
+        self.__rotation_step = 360 / self.__rotation_frames
+        self.__symmetry = self.__validate_symmetry(Symmetry(symmetry))
+        self.__cache_rotations = cache_rotations and not lazy_rotations
+        self.__lazy_rotations = lazy_rotations
+        self.__rotation_cache = RotationCache(cache_dir) if cache_dir and self.__cache_rotations else None
+        self.__rotation_cache_options = {
+            "scale": scale,
+            "alpha": alpha,
+            "angle": angle,
+            "rotation_frames": self.__rotation_frames,
+            "symmetry": self.__symmetry,
+        }
+        self.__file_hash = None
+        self.__surface_cache = SurfaceCache(cache_budget) if cache_budget > 0 else SurfaceCache.shared()
+        self.__alpha_levels = alpha_levels
+        self.__pack_rotations = pack_rotations
+        self.__masks = {}
+        self.__scaled_rotations = {}
+        self.__placeholders = {}
+        self.__loaded = False
+        self.__revision = 0
+        self.__rotation_renderer = rotation_renderer
+        if stream:
+            # Rotate and scale a blank surface like load does the image, so the placeholder gets the image's final size
+            blank_surface = pygame.Surface(ImageAsset.__read_size(fname), pygame.SRCALPHA)
+            self.__base_surface = pygame.transform.rotozoom(blank_surface, angle, scale)
+        else:
+            self.load()
+
+
+    def load(self):
+        """Loads the image, replacing the placeholder of a streamed asset. Does nothing if it's already loaded."""
+        if self.__loaded:
+            return
+
+        # Build the surface on the side, since streamed assets may be loading on another thread while they're in use
+        base_surface = pygame.transform.rotozoom(pygame.image.load(self.__fname), self.__angle, self.__scale)
         if self.__alpha != 1.0:
-            tmp = pygame.Surface(self.__base_surface.get_rect().size, pygame.SRCALPHA)
+            tmp = pygame.Surface(base_surface.get_rect().size, pygame.SRCALPHA)
             tmp.fill((255, 255, 255, self.__alpha * 255))
-            self.__base_surface.blit(tmp, (0, 0), special_flags = pygame.BLEND_RGBA_MULT)
-        self.__cache_rotations = cache_rotations
-        self.__scaled_rotations = {}
+            base_surface.blit(tmp, (0, 0), special_flags = pygame.BLEND_RGBA_MULT)
+        self.__base_surface = base_surface
         if self.__cache_rotations:
-            self.__scaled_rotations[1.0] = [
-                pygame.transform.rotozoom(self.__base_surface, i, 1.0) for i in range(0, 360)
-            ]
+            self.__scaled_rotations[1.0] = self.__load_rotations(1.0)
         else:
             self.__scaled_rotations[1.0] = [self.__base_surface]
+        # Scales cached later on render in the calling thread
+        self.__rotation_renderer = None
+        self.__placeholders = {}
+        self.__loaded = True
+        self.__revision += 1
+
+
+    @property
+    def loaded(self) -> bool:
+        return self.__loaded
+
+
+    @property
+    def revision(self) -> int:
+        """Number of times the image has been loaded. Surfaces handed out before the last load are placeholders."""
+        return self.__revision
 
 
     @property
@@ -46,10 +164,28 @@ class ImageAsset(GameObjectBase):
         return self.__base_surface
 
 
-    def get_surface(self, rotation: int = 0, scale: float = 1.0, force_cache: bool = False):
-        """Returns the image at the given rotation and scale."""
+    def get_surface(self, rotation: int = 0, scale: float = 1.0, force_cache: bool = False, alpha: float = 1.0):
+        """
+        Returns the image at the given rotation, scale and alpha. The rotation is snapped to the closest cached frame,
+        and the alpha to the closest of the asset's alpha levels.
+        """
+        frame = self.rotation_frame(rotation)
+        if not self.__loaded:
+            return self.__get_placeholder(frame, scale)
+
+        surface = self.__get_frame(frame, scale, force_cache)
+        if alpha < 1.0 and surface:
+            surface = self.__get_alpha_variant(surface, frame, scale, alpha)
+        return surface
+
+
+    def __get_frame(self, frame: int, scale: float, force_cache: bool) -> pygame.Surface:
+        """Returns the given rotation frame at the given scale."""
+        if self.__lazy_rotations:
+            return self.__get_lazy_surface(frame, scale)
+
         try:
-            return self.__scaled_rotations[scale][rotation]
+            return self.__scaled_rotations[scale][frame]
 
         except KeyError:
             rv = None
@@ -57,22 +193,222 @@ class ImageAsset(GameObjectBase):
             if force_cache:
                 logging.warn(f"ImageAsset '{self.__fname}': Force-caching scale {scale}.")
                 self.cache_scale(scale)
-                rv = self.__scaled_rotations[scale][rotation]
+                rv = self.__scaled_rotations[scale][frame]
             return rv
 
         except IndexError:
-            logging.debug(f"ImageAsset '{self.__fname}': Rotation angle {rotation} is not cached. Rotating base surface.")
-            return pygame.transform.rotozoom(self.__scaled_rotations[scale][0], rotation, scale)
+            logging.debug(f"ImageAsset '{self.__fname}': Rotation frame {frame} is not cached. Rotating base surface.")
+            return pygame.transform.rotozoom(self.__scaled_rotations[scale][0], frame * self.__rotation_step, scale)
+
+
+    def __get_placeholder(self, frame: int, scale: float) -> pygame.Surface:
+        """Returns a transparent surface the size of the given rotation frame at the given scale."""
+        if frame == 0 and scale == 1.0:
+            return self.__base_surface
+        placeholder = self.__placeholders.get((frame, scale))
+        if placeholder is None:
+            placeholder = pygame.transform.rotozoom(self.__base_surface, frame * self.__rotation_step, scale)
+            self.__placeholders[(frame, scale)] = placeholder
+        return placeholder
+
+
+    def __get_alpha_variant(self, surface: pygame.Surface, frame: int, scale: float, alpha: float) -> pygame.Surface:
+        """Returns a version of surface, the given frame at the given scale, with alpha quantized to alpha levels."""
+        level = round(alpha * self.__alpha_levels)
+        if level >= self.__alpha_levels:
+            return surface
+
+        key = (self, scale, frame, "alpha", level)
+        variant = self.__surface_cache.get(key)
+        if variant is None:
+            # The subsurface shares the frame's pixels but has an alpha of its own. It's counted at the frame's size
+            # because it keeps those pixels alive even if the frame itself gets evicted.
+            variant = surface.subsurface(surface.get_rect())
+            variant.set_alpha(round(255 * level / self.__alpha_levels))
+            self.__surface_cache.put(key, variant, SurfaceCache.surface_size(surface))
+        return variant
+
+
+    def get_mask(self, rotation: int = 0, scale: float = 1.0) -> pygame.mask.Mask:
+        """Returns the collision mask of the image at the given rotation and scale."""
+        if not self.__loaded:
+            # Placeholders don't collide with anything
+            return pygame.mask.Mask(self.get_surface(rotation, scale).get_size())
+
+        frame = self.rotation_frame(rotation)
+        source, flip_x, flip_y = self.__source_frame(frame)
+        if not (flip_x or flip_y):
+            # Frames that are the same surface as their source frame also share its mask
+            frame = source
+
+        if self.__lazy_rotations:
+            key = (self, scale, frame, "mask")
+            mask = self.__surface_cache.get(key)
+            if mask is None:
+                mask = pygame.mask.from_surface(self.__get_lazy_surface(frame, scale), ImageAsset.MASK_THRESHOLD)
+                size = mask.get_size()
+                self.__surface_cache.put(key, mask, size[0] * size[1] // 8)
+        else:
+            key = (scale, frame)
+            mask = self.__masks.get(key)
+            if mask is None:
+                mask = pygame.mask.from_surface(
+                    self.get_surface(frame * self.__rotation_step, scale, True),
+                    ImageAsset.MASK_THRESHOLD
+                )
+                self.__masks[key] = mask
+        return mask
+
+
+    def rotation_frame(self, rotation: float) -> int:
+        """Returns the index of the rotation frame that get_surface uses to draw the image at the given rotation."""
+        return round(rotation / self.__rotation_step) % self.__rotation_frames
+
+
+    @property
+    def rotation_step(self) -> float:
+        """Angle in degrees between consecutive rotation frames."""
+        return self.__rotation_step
 
 
     def cache_scale(self, scale: float):
         """Caches the image at the given scale."""
+        if self.__lazy_rotations:
+            # Every scale is cached on demand
+            return
+
         if not scale in self.__scaled_rotations:
             if self.__cache_rotations:
-                self.__scaled_rotations[scale] = [
-                    pygame.transform.rotozoom(self.__base_surface, i, scale) for i in range(360)
-                ]
+                self.__scaled_rotations[scale] = self.__load_rotations(scale)
             else:
                 self.__scaled_rotations[scale] = [pygame.transform.smoothscale_by(self.__base_surface, scale)]
         else:
             logging.warn(f"ImageAsset '{self.__fname}': Scale {scale} is already cached.")
+
+
+    def __get_lazy_surface(self, frame: int, scale: float) -> pygame.Surface:
+        """Returns the rotation frame at the given scale from the surface cache, rendering it if necessary."""
+        if frame == 0 and scale == 1.0:
+            return self.__base_surface
+
+        source, flip_x, flip_y = self.__source_frame(frame)
+        if source != frame and not (flip_x or flip_y):
+            # Rotational symmetry: the frame is the same surface as its source frame
+            return self.__get_lazy_surface(source, scale)
+
+        key = (self, scale, frame)
+        surface = self.__surface_cache.get(key)
+        if surface is None:
+            if source == frame:
+                surface = pygame.transform.rotozoom(self.__base_surface, frame * self.__rotation_step, scale)
+            else:
+                surface = pygame.transform.flip(self.__get_lazy_surface(source, scale), flip_x, flip_y)
+            self.__surface_cache.put(key, surface)
+        return surface
+
+
+    def __load_rotations(self, scale: float) -> list[pygame.Surface]:
+        """Loads all the rotation frames at the given scale from the rotation cache, rendering them if necessary."""
+        frames = None
+        if self.__rotation_cache:
+            key = self.__rotation_cache_key(scale)
+            with StartupTracer.span("Load rotations", "rotations", fname=self.__fname, scale=scale):
+                frames = self.__rotation_cache.load(key)
+        if frames is None:
+            with StartupTracer.span("Render rotations", "rotations", fname=self.__fname, scale=scale):
+                frames = self.__render_rotations(scale)
+            if self.__rotation_cache:
+                self.__rotation_cache.save(key, frames)
+        return self.__pack(frames) if self.__pack_rotations else frames
+
+
+    @staticmethod
+    def __pack(frames: list[pygame.Surface]) -> list[pygame.Surface]:
+        """Moves the frames into the shared SurfaceAtlas, keeping frames that share a surface sharing it."""
+        atlas = SurfaceAtlas.shared()
+        packed_frames = {}
+        for frame in frames:
+            if id(frame) not in packed_frames:
+                # Frames loaded from a baked atlas are already subsurfaces of it
+                packed_frames[id(frame)] = frame if frame.get_parent() else atlas.add(frame)
+        return [packed_frames[id(frame)] for frame in frames]
+
+
+    def bake(self, cache_dir: str):
+        """Bakes the rotation frames of every cached scale into atlases in cache_dir. See RotationCache."""
+        if not self.__cache_rotations:
+            return
+        rotation_cache = RotationCache(cache_dir)
+        for scale, frames in self.__scaled_rotations.items():
+            rotation_cache.bake(self.__rotation_cache_key(scale), frames)
+
+
+    def __rotation_cache_key(self, scale: float) -> str:
+        """Returns the key to the rotation frames at the given scale in a RotationCache."""
+        if self.__file_hash is None:
+            self.__file_hash = RotationCache.file_hash(self.__fname)
+        return RotationCache.key(self.__file_hash, scale, self.__rotation_cache_options)
+
+
+    def __render_rotations(self, scale: float) -> list[pygame.Surface]:
+        """Renders all the rotation frames at the given scale, rasterizing only the ones the symmetry can't derive."""
+        sources = [frame for frame in range(self.__rotation_frames) if self.__source_frame(frame)[0] == frame]
+        angles = [frame * self.__rotation_step for frame in sources]
+        if self.__rotation_renderer:
+            rendered = self.__rotation_renderer.render(self.__base_surface, angles, scale)
+        else:
+            rendered = [pygame.transform.rotozoom(self.__base_surface, angle, scale) for angle in angles]
+        rendered = dict(zip(sources, rendered))
+
+        frames = []
+        for frame in range(self.__rotation_frames):
+            source, flip_x, flip_y = self.__source_frame(frame)
+            if source == frame:
+                frames.append(rendered[frame])
+            elif flip_x or flip_y:
+                frames.append(pygame.transform.flip(frames[source], flip_x, flip_y))
+            else:
+                frames.append(frames[source])
+        return frames
+
+
+    def __source_frame(self, frame: int) -> tuple[int, bool, bool]:
+        """
+        Returns the frame that the given frame can be derived from, along with whether it needs to be flipped along
+        the x and y axes. Source frames always come before the frames derived from them.
+        """
+        if self.__symmetry == Symmetry.ROTATE_180:
+            return (frame % (self.__rotation_frames // 2), False, False)
+        elif self.__symmetry == Symmetry.ROTATE_90:
+            return (frame % (self.__rotation_frames // 4), False, False)
+        elif frame > self.__rotation_frames // 2:
+            if self.__symmetry == Symmetry.MIRROR_X:
+                return (self.__rotation_frames - frame, True, False)
+            elif self.__symmetry == Symmetry.MIRROR_Y:
+                return (self.__rotation_frames - frame, False, True)
+        return (frame, False, False)
+
+
+    @staticmethod
+    def __read_size(fname: str) -> tuple[int, int]:
+        """Returns the size of the image, read from its PNG header without decoding it."""
+        try:
+            with open(fname, "rb") as f:
+                header = f.read(24)
+            if header[:8] == b"\x89PNG\r\n\x1a\n" and header[12:16] == b"IHDR":
+                width, height = struct.unpack(">II", header[16:24])
+                return (max(1, width), max(1, height))
+        except OSError:
+            pass
+        return (1, 1)
+
+
+    def __validate_symmetry(self, symmetry: Symmetry) -> Symmetry:
+        """Ignores rotational symmetries that don't line up with the rotation frames."""
+        turns = {Symmetry.ROTATE_180: 2, Symmetry.ROTATE_90: 4}.get(symmetry)
+        if turns and self.__rotation_frames % turns != 0:
+            logging.warn(
+                f"ImageAsset '{self.__fname}': {self.__rotation_frames} rotation frames can't use symmetry {symmetry}."
+            )
+            return Symmetry.NONE
+        return symmetry
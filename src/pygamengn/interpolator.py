@@ -1,4 +1,4 @@
-import numpy
+import math
 
 from enum import StrEnum, auto
 
@@ -70,7 +70,7 @@ class Interpolator:
 
     def __ease_all(self, t: int) -> float:
         """Interpolator that eases in and out. It uses f(x) = (1 - cos(x*Pi)) / 2 in the range [0.0, 1.0] as its function."""
-        return (1.0 - numpy.cos((t / self.__duration) * numpy.pi)) / 2.0
+        return (1.0 - math.cos((t / self.__duration) * math.pi)) / 2.0
 
     def __linear(self, t: int) -> float:
         """Linear interpolator. It uses f(x) = x in the range [0.0, 1.0] as its function."""
@@ -0,0 +1,274 @@
+"""
+Inventory processing shared by GameObjectFactory and the offline tools.
+
+An inventory is made of the images, sounds, assets and game types dictionaries that GameObjectFactory.load takes.
+Before creating anything from them, the factory resolves the relative scopes of "game_object:" references, and it
+merges derived game types with their base types the first time it creates them. compile_inventory does both ahead of
+time, validates the references between entries, and returns an inventory that save_inventory writes in a compact
+binary form. GameObjectFactory.load takes the result of load_inventory with resolved=True, which skips that work.
+
+reference_graph maps which entries refer to which. Starting from the entries that the game code uses by name, like the
+game type of the game itself, reachable_entries finds every entry that the game can end up using, so that the factory
+and packitup can leave out the rest.
+"""
+import copy
+import marshal
+import struct
+
+
+MAGIC = b"PGNINV"
+VERSION = 1
+
+# Key that compiled game types keep the chain of base types they were derived from in, in place of "base_type"
+BASE_TYPES_KEY = "base_types"
+
+_header = struct.Struct("<6sH")
+
+# Kind of entry that references point to, for each prefix of the keys that hold references
+_REFERENCE_PREFIXES = {
+    "image:": "image:",
+    "sound:": "sound:",
+    "asset:": "asset:",
+    "game_object:": "game_object:",
+    "type_spec:": "game_object:",
+}
+
+
+class InventoryError(Exception):
+    """Exception raised when an inventory has broken references or can't be read."""
+
+    def __init__(self, message):
+        super().__init__(message)
+
+
+def resolve_scopes(game_types: dict) -> dict:
+    """Mutates game_types to ensure all references to game objects have absolute scopes."""
+
+    def recursive_dict_iterator(dictionary, scope=[""], parent_dict=None):
+        for key, value in dictionary.items():
+            if type(value) is dict:
+                scope.append(key)
+                yield from recursive_dict_iterator(value, scope, value)
+                scope.pop()
+            else:
+                yield (key, value, scope, parent_dict)
+
+    for key, value, scope, parent_dict in recursive_dict_iterator(game_types):
+        if key.startswith("game_object:"):
+            absolute_scope = scope[:-1]
+            if type(value) is list:
+                parent_dict[key] = ["/".join(absolute_scope + [v]) if v[0] != '/' else v for v in value]
+            else:
+                parent_dict[key] = "/".join(absolute_scope + [value]) if value[0] != '/' else value
+
+    return game_types
+
+
+def get_game_type(game_types: dict, name: str) -> dict:
+    """Returns the game type with the given scoped name, or None if there isn't one."""
+    game_type = game_types
+    for key in name.lstrip('/').split('/'):
+        if not isinstance(game_type, dict) or key not in game_type:
+            return None
+        game_type = game_type[key]
+    return game_type if isinstance(game_type, dict) else None
+
+
+def base_type_chain(game_types: dict, game_type: dict) -> list[str]:
+    """Returns the names of the base types of game_type, starting with its own base type."""
+    if BASE_TYPES_KEY in game_type:
+        return game_type[BASE_TYPES_KEY]
+    base_types = []
+    base_type = game_type.get("base_type")
+    while base_type and base_type not in base_types:
+        base_types.append(base_type)
+        parent_type = get_game_type(game_types, base_type)
+        base_type = parent_type.get("base_type") if parent_type else None
+    return base_types
+
+
+def derive_type(parent_type: dict, child_type: dict) -> dict:
+    """Builds a dictionary for a game type by merging the child type's dictionary with its base type's."""
+    merged_type = copy.deepcopy(parent_type)
+    for child_key in child_type:
+        if child_key != "base_type":
+            _recursive_copy(child_type, merged_type, child_key)
+    return merged_type
+
+
+def reference_graph(images: dict, sounds: dict, assets: dict, game_types: dict) -> dict[str, set[str]]:
+    """
+    Returns the references between the entries of an inventory whose scopes are resolved. Each entry is a node named
+    after its kind and name, like "image:ship", "asset:RenderGroup" or "game_object:/Ship/Mover", and maps to the set of
+    nodes that it refers to. Derived game types refer to their base types. References to entries that don't exist
+    point to nodes that aren't in the graph.
+    """
+    graph = {}
+    for name, image in images.items():
+        graph[f"image:{name}"] = _references(image)
+    for name in sounds:
+        graph[f"sound:{name}"] = set()
+    for name, asset in assets.items():
+        graph[f"asset:{name}"] = _references(asset)
+    for path, game_type in _iterate_game_types(game_types):
+        graph[f"game_object:{path}"] = _references(game_type)
+    return graph
+
+
+def reachable_entries(graph: dict[str, set[str]], roots) -> set[str]:
+    """Returns the nodes of graph that can be reached from the nodes in roots, including the roots themselves."""
+    reachable = set()
+    pending = [_node(root) for root in roots]
+    while pending:
+        node = pending.pop()
+        if node not in reachable:
+            reachable.add(node)
+            pending.extend(graph.get(node, ()))
+    return reachable
+
+
+def missing_references(graph: dict[str, set[str]]) -> list[tuple[str, str]]:
+    """Returns a (node, reference) tuple for every reference in graph to an entry that doesn't exist."""
+    return [
+        (node, reference)
+        for node, references in graph.items()
+        for reference in sorted(references)
+        if reference not in graph
+    ]
+
+
+def compile_inventory(
+    images: dict,
+    sounds: dict,
+    assets: dict,
+    game_types: dict,
+    fonts: dict = None,
+    roots: list[str] = None
+) -> dict:
+    """
+    Resolves the scopes and base types of the inventory and validates its references. Returns the compiled inventory,
+    or raises InventoryError listing every broken reference. The given dictionaries are left untouched. The roots,
+    the nodes of the reference graph that the game code uses by name, are kept in the compiled inventory for
+    GameObjectFactory.load.
+    """
+    game_types = resolve_scopes(copy.deepcopy(game_types))
+
+    # Types with an unknown base type keep their "base_type", which the validation reports as a missing reference
+    derived_types = []
+    for path, game_type in _iterate_game_types(game_types):
+        if "base_type" in game_type:
+            parent_type = get_game_type(game_types, game_type["base_type"])
+            if parent_type is not None:
+                derived_types.append((path, game_type, parent_type))
+
+    # Merge from the types as written, like the factory does, before replacing any of them with its merged version
+    merged_types = []
+    for path, game_type, parent_type in derived_types:
+        merged_type = derive_type(parent_type, game_type)
+        merged_type.pop("base_type", None)
+        merged_type[BASE_TYPES_KEY] = base_type_chain(game_types, game_type)
+        merged_types.append((path, merged_type))
+    for path, merged_type in merged_types:
+        parent_path, _, key = path.rpartition("/")
+        container = get_game_type(game_types, parent_path) if parent_path else game_types
+        container[key] = merged_type
+
+    errors = _validate(reference_graph(images, sounds, assets, game_types))
+    if errors:
+        raise InventoryError("Invalid inventory:\n    " + "\n    ".join(errors))
+
+    return {
+        "images": copy.deepcopy(images),
+        "sounds": dict(sounds),
+        "assets": copy.deepcopy(assets),
+        "fonts": dict(fonts or {}),
+        "game_types": game_types,
+        "roots": list(roots or []),
+    }
+
+
+def save_inventory(path: str, inventory: dict):
+    """Writes a compiled inventory to path."""
+    with open(path, "wb") as f:
+        f.write(_header.pack(MAGIC, VERSION))
+        f.write(marshal.dumps(inventory))
+
+
+def load_inventory(path: str) -> dict:
+    """Reads a compiled inventory written by save_inventory."""
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        magic, version = _header.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise InventoryError(f"'{path}' is not a compiled inventory of version {VERSION}")
+        return marshal.loads(data[_header.size:])
+    except (struct.error, ValueError, EOFError, TypeError) as e:
+        raise InventoryError(f"'{path}' is corrupt: {e}")
+
+
+def _iterate_game_types(dictionary: dict, scope: str = ""):
+    """Yields the scoped name and dictionary of every game type, including the ones nested in other game types."""
+    for key, value in dictionary.items():
+        if isinstance(value, dict) and key != "kwargs":
+            path = f"{scope}/{key}"
+            if "class_name" in value or "base_type" in value:
+                yield (path, value)
+            yield from _iterate_game_types(value, path)
+
+
+def _validate(graph: dict[str, set[str]]) -> list[str]:
+    """Returns a description of every reference in the inventory that points to an entry that doesn't exist."""
+    errors = []
+    for node, reference in missing_references(graph):
+        kind, _, name = reference.partition(":")
+        errors.append(f"{node}: Refers to unknown {kind} '{name}'")
+    return errors
+
+
+def _references(entry: dict) -> set[str]:
+    """Returns the nodes that an inventory entry refers to through its kwargs, groups, attachments and base types."""
+    references = set()
+    for key, value in entry.get("kwargs", {}).items():
+        for prefix, kind in _REFERENCE_PREFIXES.items():
+            if key.startswith(prefix):
+                references.update(_node(kind + name) for name in _names(value))
+                break
+    for group in entry.get("groups") or []:
+        references.add(f"asset:{group}")
+    for attachment in entry.get("attachments") or []:
+        references.add(_node(f"game_object:{attachment["game_type"]}"))
+    base_types = entry.get(BASE_TYPES_KEY) or ([entry["base_type"]] if "base_type" in entry else [])
+    for base_type in base_types:
+        references.add(_node(f"game_object:{base_type}"))
+    return references
+
+
+def _names(value):
+    """Yields the names in a reference value, which can be a name or a list of them, nested in lists at any depth."""
+    if isinstance(value, list):
+        for v in value:
+            yield from _names(v)
+    elif isinstance(value, str):
+        yield value
+
+
+def _node(name: str) -> str:
+    """Returns the node name for a reference, with an absolute scope for game types."""
+    kind, _, name = name.partition(":")
+    if kind == "game_object":
+        name = "/" + name.lstrip('/')
+    return f"{kind}:{name}"
+
+
+def _recursive_copy(from_obj, to_obj, key):
+    """Recursively copies dictionary keys."""
+    if isinstance(from_obj[key], dict):
+        for subkey in from_obj[key]:
+            if not key in to_obj:
+                to_obj[key] = {}
+            _recursive_copy(from_obj[key], to_obj[key], subkey)
+    elif isinstance(from_obj[key], list):
+        to_obj[key] = copy.deepcopy(from_obj[key])
+    else:
+        to_obj[key] = from_obj[key]
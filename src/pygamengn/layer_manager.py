@@ -21,26 +21,54 @@ class LayerManager(GameObjectBase):
     def __init__(self, layers):
         self.layers = layers
 
+    @property
+    def layers(self):
+        return self.__layers
+
+    @layers.setter
+    def layers(self, layers):
+        """Sets the layers and indexes every name in them, so that looking up a layer doesn't need to scan them."""
+        self.__layers = layers
+        self.__layer_ids = {}
+        for index, layer in enumerate(layers):
+            for name in layer:
+                # A name that appears in several layers belongs to the first one
+                self.__layer_ids.setdefault(name.lstrip('/'), index)
+        self.__resolved_layer_ids = {}
+
     def get_layer_id(self, name):
         """Returns the layer for the given game type name."""
-        for index, layer in enumerate(self.layers):
-            if name in layer:
-                return index
-        return self.INVALID_LAYER_ID
+        return self.__layer_ids.get(name.lstrip('/'), self.INVALID_LAYER_ID)
 
-    def set_layer_id(self, gob, scoped_name, class_name):
+    def set_layer_id(self, gob, scoped_name, class_name, base_types=()):
         """Sets the gob's layer id using scoped_name first and class_name second to find the right layer."""
-        # Get layer id for the GameObject only if it's in the RenderGroup
-        layer_id = self.get_layer_id(scoped_name)
-        if layer_id == self.INVALID_LAYER_ID:
-            layer_id = self.get_layer_id(class_name)
-
+        layer_id = self.resolve_layer_id(scoped_name, class_name, base_types)
         if layer_id != LayerManager.INVALID_LAYER_ID:
             gob.set_layer_id(layer_id)
-        else:
+
+    def resolve_layer_id(self, scoped_name, class_name, base_types=()):
+        """
+        Returns the layer id for scoped_name, or for the first of its base_types (the chain of base types that the game
+        type derives from) that has one, or for class_name if none of them has a layer. Results are cached, so each
+        game type is only resolved once.
+        """
+        key = (scoped_name, class_name, tuple(base_types))
+        layer_id = self.__resolved_layer_ids.get(key)
+        if layer_id is not None:
+            return layer_id
+
+        layer_id = self.INVALID_LAYER_ID
+        for name in (scoped_name, *base_types, class_name):
+            layer_id = self.get_layer_id(name)
+            if layer_id != self.INVALID_LAYER_ID:
+                break
+
+        if layer_id == LayerManager.INVALID_LAYER_ID:
             logging.warn(
                 "Game type name '{0}' of class '{1}' doesn't have an assigned layer in LayerManager".format(
                     scoped_name,
                     class_name
                 )
             )
+        self.__resolved_layer_ids[key] = layer_id
+        return layer_id
@@ -1,4 +1,5 @@
-import numpy
+import math
+
 import pygame
 
 from pygamengn.class_registrar import ClassRegistrar
@@ -12,6 +13,10 @@ class Mover(GameObjectBase):
     def move(self, delta, pos, heading):
         pass
 
+    def recycle(self):
+        """Resets the mover to its initial state when the game object that owns it is recycled."""
+        pass
+
 
 @ClassRegistrar.register("MoverVelocity")
 class MoverVelocity(Mover):
@@ -22,18 +27,22 @@ class MoverVelocity(Mover):
         self.max_velocity = max_velocity
         self.angular_velocity = angular_velocity
         self._velocity_decay_interp = AutoInterpolator(velocity_decay_ms, 1, 0 if velocity_decay_ms > -1 else 1)
+        self.__initial_velocity = velocity
 
     def move(self, delta, pos, heading):
         """Computes movement from the given parameters."""
         if self.velocity > 0:
-            theta = numpy.deg2rad(90 - heading)
-            direction = pygame.Vector2(numpy.cos(theta), numpy.sin(theta))
+            theta = math.radians(90 - heading)
+            direction = pygame.Vector2(math.cos(theta), math.sin(theta))
             delta_pos = direction * delta / -1000.0 * self.velocity
             self.velocity = self.velocity * self._velocity_decay_interp.update(delta)
             return (pos + delta_pos, heading)
         else:
             return (pos, heading)
 
+    def recycle(self):
+        self.set_velocity(self.__initial_velocity)
+
     def set_velocity(self, velocity):
         self.velocity = velocity
         self._velocity_decay_interp.time = 0
@@ -46,10 +55,14 @@ class MoverVelDir(Mover):
     def __init__(self, velocity, direction):
         self.velocity = velocity
         self.direction = direction
+        self.__initial_state = (velocity, direction)
 
     def move(self, delta, *_):
         return self.direction * delta / 1000.0 * self.velocity
 
+    def recycle(self):
+        self.velocity, self.direction = self.__initial_state
+
     def set_velocity(self, velocity):
         self.velocity = velocity
 
@@ -79,6 +92,9 @@ class MoverTime(Mover):
         self.__elapsed_time += delta
         return self.__interpolator.get(self.__elapsed_time)
 
+    def recycle(self):
+        self.__elapsed_time = 0
+
     @property
     def duration(self):
         return self.__duration
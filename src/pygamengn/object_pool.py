@@ -0,0 +1,38 @@
+from collections import deque
+
+
+class ObjectPool:
+    """
+    Keeps up to size killed game objects of one game type, for GameObjectFactory to recycle instead of creating new
+    ones.
+
+    Game types opt into pooling in the inventory with a "pool" entry, e.g., "pool": {"size": 64}. Pooled objects are
+    handed out first in, first out, so that an object that was just killed isn't reused while other objects may still
+    be holding on to it during the same frame.
+    """
+
+    def __init__(self, size: int):
+        self.__size = size
+        self.__objects = deque()
+
+
+    def acquire(self):
+        """Returns a pooled object, or None if the pool is empty."""
+        return self.__objects.popleft() if self.__objects else None
+
+
+    def release(self, gob) -> bool:
+        """Adds gob to the pool. Returns False if the pool is full, in which case the object is simply dropped."""
+        if len(self.__objects) >= self.__size:
+            return False
+        self.__objects.append(gob)
+        return True
+
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+
+    def __len__(self) -> int:
+        return len(self.__objects)
@@ -1,17 +1,12 @@
 from pygamengn.class_registrar import ClassRegistrar
+from pygamengn.entity import Entity
 from pygamengn.game_object import GameObject
 
 
-@ClassRegistrar.register("Projectile")
-class Projectile(GameObject):
+class ProjectileMixin:
+    """Movement and collisions of projectiles, which Projectile and ProjectileEntity share."""
 
-    def __init__(self, mover, **kwargs):
-        super().__init__(**kwargs)
-        self.mover = mover
-
-    def kill_when_off_screen(self):
-        """This can be used by the Sprite Group to know if the object should be killed when it goes off screen."""
-        return True
+    __slots__ = ()
 
     def update(self, delta):
         self.position, self.heading = self.mover.move(delta, self.position, self.heading)
@@ -21,7 +16,36 @@ class Projectile(GameObject):
         """Reacts to collision against game object gob."""
         # Set own position to the collision point so the explosion will play there when self dies
         self.position = world_pos
-        instigator = GameObject.get_root_parent(gob)
-        self.take_damage(self.health, instigator)
+        self.take_damage(self.health, gob.root_parent)
         # Apply damage to the collided sprite
         super().handle_collision(gob, world_pos)
+
+
+@ClassRegistrar.register("Projectile")
+class Projectile(ProjectileMixin, GameObject):
+
+    def __init__(self, mover, **kwargs):
+        super().__init__(**kwargs)
+        self.mover = mover
+
+    def recycle(self, **kwargs):
+        super().recycle(**kwargs)
+        self.mover.recycle()
+
+    def kill_when_off_screen(self):
+        """This can be used by the Sprite Group to know if the object should be killed when it goes off screen."""
+        return True
+
+
+@ClassRegistrar.register("ProjectileEntity")
+class ProjectileEntity(ProjectileMixin, Entity):
+    """Projectile that is an Entity rather than a GameObject, for game types that fire many of them."""
+
+    __slots__ = ()
+
+    def __init__(self, mover, **kwargs):
+        super().__init__(mover=mover, **kwargs)
+
+    def recycle(self, **kwargs):
+        super().recycle(**kwargs)
+        self.mover.recycle()
@@ -3,8 +3,8 @@ import pygame
 
 from pygamengn.blit_surface import BlitSurface
 from pygamengn.class_registrar import ClassRegistrar
-from pygamengn.game_object import GameObject
 from pygamengn.game_object_base import GameObjectBase
+from pygamengn.game_object_core import GameObjectCore
 
 
 @ClassRegistrar.register("RenderGroup")
@@ -75,7 +75,7 @@ class RenderGroup(pygame.sprite.LayeredUpdates, GameObjectBase):
         surface.blits(blits, doreturn = False)
 
 
-    def __draw_sprite(self, sprite: GameObject, blits: list[BlitSurface]):
+    def __draw_sprite(self, sprite: GameObjectCore, blits: list[BlitSurface]):
         transformed_rect = sprite.rect.move(self.cam)
         if not self.view_rect.colliderect(transformed_rect):
             # Ignore sprites that are outside of the view rectangle, but warn them that they're off the screen
@@ -0,0 +1,203 @@
+import hashlib
+import json
+import logging
+import os
+import struct
+import sys
+import threading
+
+import pygame
+
+from pygamengn.surface_packer import ShelfPacker
+
+
+class RotationCache:
+    """
+    On-disk cache of pre-rendered ImageAsset rotation frames.
+
+    Each cache file holds the rotation frames of one image at one scale. The file starts with a small header: a magic
+    string, the format version and the length of a JSON index. The index has one entry per frame, which is either an
+    [offset, width, height] list pointing into the raw RGBA pixel data that follows the index, or the integer index of
+    an earlier frame that shares the same surface. Files are memory-mapped when possible, so loading them is a single
+    read with no decoding involved.
+
+    Frames can also be baked ahead of time (see packitup.py) into a PNG atlas with a JSON index next to it. The index
+    has the same structure as the one in the raw files, with [x, y, width, height] lists locating each frame in the
+    atlas. Baked atlases are much smaller than raw files, which makes them the format to ship, and they're only read
+    when there's no raw file for the same key.
+
+    Cache keys hash the contents of the image file together with the options the frames were rendered with, so any
+    change to the image or to its inventory kwargs results in a different cache file. Raw files are also named after
+    the pygame version that rendered them, since rotozoom's output can change between pygame and SDL releases, so an
+    upgrade renders the frames again rather than reuse stale ones. Baked atlases are shipped with the game and read by
+    whatever pygame runs it (e.g., pygbag in the browser), so their names don't include the version.
+    """
+
+    MAGIC = b"PGNROT"
+    VERSION = 1
+    EXTENSION = ".rot"
+    BAKED_EXTENSION = ".png"
+    BAKED_INDEX_EXTENSION = ".json"
+
+    __header = struct.Struct("<6sHI")
+
+    def __init__(self, cache_dir: str):
+        self.__cache_dir = cache_dir
+
+
+    @classmethod
+    def key(cls, file_hash: str, scale: float, options: dict) -> str:
+        """Returns the cache key for the frames of an image file rendered at scale with the given options."""
+        key_data = json.dumps([cls.VERSION, file_hash, scale, options], sort_keys = True)
+        return hashlib.sha1(key_data.encode()).hexdigest()
+
+
+    @staticmethod
+    def file_hash(fname: str) -> str:
+        """Returns the hash of the contents of the given file."""
+        with open(fname, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+
+    def load(self, key: str) -> list[pygame.Surface]:
+        """Returns the frames cached under key, or None if they're not in the cache."""
+        path = self.__raw_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = RotationCache.__map_file(f)
+        except FileNotFoundError:
+            return self.__load_baked(key)
+
+        try:
+            magic, version, index_size = RotationCache.__header.unpack_from(data)
+            if magic != RotationCache.MAGIC or version != RotationCache.VERSION:
+                logging.warn(f"RotationCache: Ignoring '{path}' because its format is not supported")
+                return None
+            index_start = RotationCache.__header.size
+            index = json.loads(bytes(data[index_start:index_start + index_size]))
+            pixels = memoryview(data)[index_start + index_size:]
+            frames = []
+            for entry in index:
+                if isinstance(entry, int):
+                    frames.append(frames[entry])
+                else:
+                    offset, width, height = entry
+                    frames.append(
+                        pygame.image.frombuffer(pixels[offset:offset + width * height * 4], (width, height), "RGBA")
+                    )
+            return frames
+        except (ValueError, IndexError, struct.error) as e:
+            logging.warn(f"RotationCache: Ignoring corrupt file '{path}': {e}")
+            return None
+
+
+    def save(self, key: str, frames: list[pygame.Surface]):
+        """Writes the frames to the cache under key."""
+        if sys.platform == "emscripten":
+            # There's nowhere persistent to write to in the browser
+            return
+
+        index = []
+        pixels = []
+        offset = 0
+        frame_indices = {}
+        for frame in frames:
+            source = frame_indices.get(id(frame))
+            if source is not None:
+                index.append(source)
+            else:
+                frame_indices[id(frame)] = len(index)
+                index.append([offset, frame.get_width(), frame.get_height()])
+                data = pygame.image.tobytes(frame, "RGBA")
+                pixels.append(data)
+                offset += len(data)
+        index_data = json.dumps(index, separators = (",", ":")).encode()
+
+        path = self.__raw_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.__cache_dir, exist_ok = True)
+            with open(tmp_path, "wb") as f:
+                f.write(RotationCache.__header.pack(RotationCache.MAGIC, RotationCache.VERSION, len(index_data)))
+                f.write(index_data)
+                f.writelines(pixels)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warn(f"RotationCache: Unable to write '{path}': {e}")
+        finally:
+            # Don't leave partial files behind if writing failed, e.g., because the disk is full
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+    def bake(self, key: str, frames: list[pygame.Surface]):
+        """Packs the frames into an atlas and writes it to the cache under key, along with its index."""
+        unique_frames = []
+        frame_indices = {}
+        sources = []
+        for i, frame in enumerate(frames):
+            source = frame_indices.setdefault(id(frame), i)
+            if source == i:
+                unique_frames.append(frame)
+            sources.append(source)
+
+        size, rects = ShelfPacker().pack([frame.get_size() for frame in unique_frames])
+        atlas = pygame.Surface(size, pygame.SRCALPHA)
+        # The atlas starts out fully transparent, so blending with max copies the frames without altering their pixels
+        atlas.blits(
+            [(frame, rect, None, pygame.BLEND_RGBA_MAX) for frame, rect in zip(unique_frames, rects)],
+            doreturn = False
+        )
+        rects = iter(rects)
+        index = [list(next(rects)) if source == i else source for i, source in enumerate(sources)]
+
+        os.makedirs(self.__cache_dir, exist_ok = True)
+        pygame.image.save(atlas, self.__path(key, RotationCache.BAKED_EXTENSION))
+        with open(self.__path(key, RotationCache.BAKED_INDEX_EXTENSION), "w") as f:
+            json.dump({"version": RotationCache.VERSION, "frames": index}, f, separators = (",", ":"))
+
+
+    def __load_baked(self, key: str) -> list[pygame.Surface]:
+        """Returns the frames baked under key, or None if they haven't been baked."""
+        index_path = self.__path(key, RotationCache.BAKED_INDEX_EXTENSION)
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        if index.get("version") != RotationCache.VERSION:
+            logging.warn(f"RotationCache: Ignoring '{index_path}' because its format is not supported")
+            return None
+
+        atlas = pygame.image.load(self.__path(key, RotationCache.BAKED_EXTENSION))
+        frames = []
+        for entry in index["frames"]:
+            if isinstance(entry, int):
+                frames.append(frames[entry])
+            else:
+                frames.append(atlas.subsurface(entry))
+        return frames
+
+
+    def __path(self, key: str, extension: str = EXTENSION) -> str:
+        return os.path.join(self.__cache_dir, key + extension)
+
+
+    def __raw_path(self, key: str) -> str:
+        """Returns the path of the raw file for key, which only the pygame version that wrote it reads."""
+        return self.__path(f"{key}-{pygame.version.ver}")
+
+
+    @staticmethod
+    def __map_file(f):
+        """Memory-maps the file, falling back to reading it in platforms without mmap (e.g., the browser)."""
+        try:
+            import mmap
+            # Copy-on-write mapping so that surfaces built on top of it can never write back to the file
+            return mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_COPY)
+        except (ImportError, OSError, ValueError):
+            return bytearray(f.read())
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable
+
+import pygame
+
+
+class RotationRenderer:
+    """
+    Renders the rotation frames of ImageAssets in an executor, so that the rotations of several images, and the frames
+    of a single image, render on several cores at once.
+
+    The executor is usually a ProcessPoolExecutor (see RotationRenderer.process_pool), since rotozoom holds the GIL.
+    Pixels travel to and from the workers as raw RGBA buffers, and the frames that come back are Surfaces that wrap
+    those buffers rather than copies of them.
+
+    The executor can be given as a function that creates it, in which case it's only created the first time there are
+    frames to render. Starting worker processes takes longer than loading rotations from the cache, so games whose
+    rotations are all cached never start them.
+    """
+
+    # Fewer frames per task than this cost more to send to a worker than they take to render
+    MIN_FRAMES_PER_TASK = 8
+
+    def __init__(self, executor: Executor | Callable[[], Executor], workers: int):
+        self.__executor = executor if isinstance(executor, Executor) else None
+        self.__create_executor = None if isinstance(executor, Executor) else executor
+        self.__workers = workers
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def process_pool(cls, workers: int) -> RotationRenderer:
+        """
+        Returns a RotationRenderer that renders in a pool of workers processes, which starts the first time there are
+        frames to render. The processes are spawned rather than forked, since the factory renders from its loading
+        threads and forking a process with threads isn't safe.
+        """
+        return cls(lambda: ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")), workers)
+
+    @property
+    def started(self) -> bool:
+        """Whether the executor exists, i.e., it was given or there were frames to render."""
+        return self.__executor is not None
+
+    def render(self, surface: pygame.Surface, angles: list[float], scale: float) -> list[pygame.Surface]:
+        """Returns surface rotated by each of the angles and scaled by scale, like pygame.transform.rotozoom."""
+        pixels = pygame.image.tobytes(surface, "RGBA")
+        chunk_size = max(self.MIN_FRAMES_PER_TASK, -(-len(angles) // self.__workers))
+        executor = self.__get_executor()
+        futures = [
+            executor.submit(_rotozoom, pixels, surface.get_size(), angles[i:i + chunk_size], scale)
+            for i in range(0, len(angles), chunk_size)
+        ]
+        return [
+            pygame.image.frombuffer(buffer, size, "RGBA")
+            for future in futures
+            for buffer, size in future.result()
+        ]
+
+    def shutdown(self):
+        """Shuts the executor down once the frames it's rendering are done."""
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown()
+
+    def __get_executor(self) -> Executor:
+        """Returns the executor, creating it if necessary. Images render from several loading threads at once."""
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = self.__create_executor()
+            return self.__executor
+
+
+def _rotozoom(pixels: bytes, size: tuple[int, int], angles: list[float], scale: float) -> list[tuple[bytes, tuple]]:
+    """Runs in a worker. Returns the buffer and size of each rotation of the image in pixels."""
+    surface = pygame.image.frombuffer(pixels, size, "RGBA")
+    frames = []
+    for angle in angles:
+        frame = pygame.transform.rotozoom(surface, angle, scale)
+        frames.append((pygame.image.tobytes(frame, "RGBA"), frame.get_size()))
+    return frames
@@ -0,0 +1,152 @@
+import contextlib
+import importlib.abc
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+
+class StartupTracer:
+    """
+    Records a timeline of how long starting a game takes, as nested spans of time.
+
+    Spans are recorded with StartupTracer.span, which does nothing until the tracer is enabled. Once it is, the tracer
+    also records the import of every module that hasn't been imported yet. GameObjectFactory.load records a span for
+    each of its stages and for every image, sound and asset that it creates.
+
+    The timeline is saved in the Chrome trace event format, which chrome://tracing and https://ui.perfetto.dev show
+    as a flame graph with one row for each thread. StartupTracer.summary lists the assets that took the longest.
+
+    Games usually call enable_from_environment as early as possible, and finish once they're up and running, so that
+    setting the PYGAMENGN_TRACE environment variable to a file name is all it takes to trace their startup.
+    """
+
+    ENVIRONMENT_VARIABLE = "PYGAMENGN_TRACE"
+
+    # Categories of the spans that GameObjectFactory.load records for each image, sound and asset
+    ASSET_CATEGORIES = ("image", "sound", "asset")
+
+    enabled = False
+    __events = []
+    __path = None
+    __import_tracer = None
+    __no_span = contextlib.nullcontext()
+
+    @classmethod
+    def enable(cls, path: str = None, trace_imports: bool = True):
+        """Starts recording. If path is given, finish saves the timeline there."""
+        cls.enabled = True
+        cls.__events = []
+        cls.__path = path
+        if trace_imports and cls.__import_tracer is None:
+            cls.__import_tracer = _ImportTracer()
+            sys.meta_path.insert(0, cls.__import_tracer)
+
+    @classmethod
+    def enable_from_environment(cls) -> bool:
+        """Enables the tracer if the PYGAMENGN_TRACE environment variable names the file to save the timeline to."""
+        path = os.environ.get(cls.ENVIRONMENT_VARIABLE)
+        if path:
+            cls.enable(path)
+        return cls.enabled
+
+    @classmethod
+    def disable(cls):
+        """Stops recording. The spans recorded so far are kept."""
+        cls.enabled = False
+        if cls.__import_tracer is not None:
+            sys.meta_path.remove(cls.__import_tracer)
+            cls.__import_tracer = None
+
+    @classmethod
+    def span(cls, name: str, category: str = "startup", **args):
+        """Returns a context manager that records the time it takes to run its block under the given name."""
+        if not cls.enabled:
+            return cls.__no_span
+        return cls.__span(name, category, args)
+
+    @classmethod
+    @contextlib.contextmanager
+    def __span(cls, name, category, args):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            cls.__events.append(event)
+
+    @classmethod
+    def events(cls) -> list[dict]:
+        """Returns the spans recorded so far as Chrome trace events."""
+        return list(cls.__events)
+
+    @classmethod
+    def save(cls, path: str):
+        """Saves the spans recorded so far to path as a Chrome trace."""
+        with open(path, "w") as f:
+            json.dump({"traceEvents": cls.events(), "displayTimeUnit": "ms"}, f)
+
+    @classmethod
+    def summary(cls, count: int = 10, categories = ASSET_CATEGORIES) -> str:
+        """Returns a table with the count spans of the given categories that took the longest."""
+        events = sorted((e for e in cls.__events if e["cat"] in categories), key=lambda e: e["dur"], reverse=True)
+        lines = [f"{count} slowest of {len(events)} {", ".join(categories)} spans:"]
+        for event in events[:count]:
+            lines.append(f"{event["dur"] / 1000:10.3f} ms  {event["cat"]:<6} {event["name"]}")
+        return "\n".join(lines)
+
+    @classmethod
+    def finish(cls, count: int = 10):
+        """Stops recording, saves the timeline if enable was given a path, and logs the summary."""
+        if not cls.enabled:
+            return
+        cls.disable()
+        if cls.__path:
+            cls.save(cls.__path)
+            logging.info(f"Saved startup trace to {os.path.abspath(cls.__path)}")
+        logging.info(cls.summary(count))
+
+
+class _ImportTracer(importlib.abc.MetaPathFinder):
+    """Finds modules with the other finders in sys.meta_path, and wraps their loaders to record their execution."""
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TracedLoader(spec.loader)
+                return spec
+        return None
+
+
+class _TracedLoader(importlib.abc.Loader):
+    """Loader that records a span for the execution of a module, and forwards everything else to its loader."""
+
+    def __init__(self, loader):
+        self.__loader = loader
+
+    def create_module(self, spec):
+        return self.__loader.create_module(spec)
+
+    def exec_module(self, module):
+        with StartupTracer.span(module.__name__, "import"):
+            self.__loader.exec_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self.__loader, name)
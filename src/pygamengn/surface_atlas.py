@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+
+import pygame
+
+from pygamengn.surface_packer import SkylinePacker
+
+
+class SurfaceAtlas:
+    """
+    Packs surfaces into a few large pages, handing out subsurfaces of the pages in place of the original surfaces.
+
+    Packing many small surfaces together saves their individual allocations and keeps pixels that are drawn together
+    close to each other in memory. Subsurfaces behave like any other surface, so the rest of the engine doesn't need to
+    know whether a surface lives in an atlas. Surfaces that don't fit in a page are returned as they are. Surfaces can
+    be added from several threads at once, e.g., by ImageAssets loaded in the background by GameObjectFactory.
+    """
+
+    DEFAULT_PAGE_SIZE = (2048, 2048)
+
+    __shared_atlas = None
+
+    def __init__(self, page_size: tuple[int, int] = DEFAULT_PAGE_SIZE):
+        self.__page_size = page_size
+        self.__pages = []
+        self.__lock = threading.Lock()
+
+
+    def add(self, surface: pygame.Surface) -> pygame.Surface:
+        """Copies surface into the atlas and returns the subsurface of the page that holds it."""
+        width, height = surface.get_size()
+        if width > self.__page_size[0] or height > self.__page_size[1]:
+            return surface
+
+        with self.__lock:
+            return self.__add(surface, width, height)
+
+
+    def __add(self, surface: pygame.Surface, width: int, height: int) -> pygame.Surface:
+        for page, packer in reversed(self.__pages):
+            rect = packer.insert(width, height)
+            if rect:
+                break
+        else:
+            page = pygame.Surface(self.__page_size, pygame.SRCALPHA)
+            packer = SkylinePacker(*self.__page_size)
+            self.__pages.append((page, packer))
+            rect = packer.insert(width, height)
+
+        # Pages start out fully transparent, so blending with max copies the surface without altering its pixels
+        page.blit(surface, rect, special_flags = pygame.BLEND_RGBA_MAX)
+        return page.subsurface(rect)
+
+
+    @property
+    def pages(self) -> list[pygame.Surface]:
+        return [page for page, _ in self.__pages]
+
+
+    @classmethod
+    def shared(cls) -> SurfaceAtlas:
+        """Returns the atlas shared by all the users that don't own an atlas of their own."""
+        if cls.__shared_atlas is None:
+            cls.__shared_atlas = SurfaceAtlas()
+        return cls.__shared_atlas
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+
+class SurfaceCache:
+    """
+    Least-recently-used cache of surfaces bounded by a memory budget in bytes.
+
+    Entries are evicted starting with the least recently used one whenever the total size of the cached surfaces goes
+    over the budget. The most recently added entry is never evicted, even if it doesn't fit in the budget on its own.
+    """
+
+    DEFAULT_BUDGET = 64 * 1024 * 1024
+
+    __shared_cache = None
+
+    def __init__(self, budget: int = DEFAULT_BUDGET):
+        self.__budget = budget
+        self.__size = 0
+        self.__entries = OrderedDict()
+
+
+    def get(self, key):
+        """Returns the value cached under key, or None if it's not in the cache."""
+        try:
+            entry = self.__entries[key]
+        except KeyError:
+            return None
+        self.__entries.move_to_end(key)
+        return entry[0]
+
+
+    def put(self, key, value, size: int = None):
+        """Caches value under key. The size in bytes is computed from value if it's a pygame.Surface and not given."""
+        if size is None:
+            size = SurfaceCache.surface_size(value)
+        old_entry = self.__entries.pop(key, None)
+        if old_entry:
+            self.__size -= old_entry[1]
+        self.__entries[key] = (value, size)
+        self.__size += size
+        self.__evict()
+
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        self.__entries.clear()
+        self.__size = 0
+
+
+    @property
+    def budget(self) -> int:
+        return self.__budget
+
+    @budget.setter
+    def budget(self, budget: int):
+        self.__budget = budget
+        self.__evict()
+
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached values."""
+        return self.__size
+
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+    def __contains__(self, key) -> bool:
+        return key in self.__entries
+
+
+    def __evict(self):
+        """Evicts least recently used entries until the cache fits in its budget."""
+        while self.__size > self.__budget and len(self.__entries) > 1:
+            _, (_, size) = self.__entries.popitem(last = False)
+            self.__size -= size
+
+
+    @classmethod
+    def shared(cls) -> SurfaceCache:
+        """Returns the cache shared by all the users that don't own a cache of their own."""
+        if cls.__shared_cache is None:
+            cls.__shared_cache = SurfaceCache()
+        return cls.__shared_cache
+
+
+    @staticmethod
+    def surface_size(surface: pygame.Surface) -> int:
+        """Returns the size in bytes of the pixel data of the given surface."""
+        return surface.get_pitch() * surface.get_height()
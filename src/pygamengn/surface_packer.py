@@ -0,0 +1,107 @@
+import pygame
+
+
+class ShelfPacker:
+    """
+    Packs rectangles into a sheet of fixed width by placing them left to right on shelves, tallest first.
+
+    Shelf packing wastes the space above the shorter rectangles on each shelf, but it's fast and predictable, which is
+    all that rotation frames of a single image need because they all have similar sizes.
+    """
+
+    def __init__(self, max_width: int = 4096, padding: int = 1):
+        self.max_width = max_width
+        self.padding = padding
+
+
+    def pack(self, sizes: list[tuple[int, int]]) -> tuple[tuple[int, int], list[pygame.Rect]]:
+        """Returns the size of the sheet and the rectangles where each of the given sizes goes in the sheet."""
+        rects = [None] * len(sizes)
+        x = y = shelf_height = sheet_width = 0
+        for i in sorted(range(len(sizes)), key = lambda i: sizes[i][1], reverse = True):
+            width, height = sizes[i]
+            if x > 0 and x + width > self.max_width:
+                y += shelf_height + self.padding
+                x = shelf_height = 0
+            rects[i] = pygame.Rect(x, y, width, height)
+            x += width + self.padding
+            shelf_height = max(shelf_height, height)
+            sheet_width = max(sheet_width, x - self.padding)
+        return ((sheet_width, y + shelf_height), rects)
+
+
+class SkylinePacker:
+    """
+    Packs rectangles one at a time into a sheet of fixed size using the bottom-left skyline heuristic.
+
+    The packer keeps track of the skyline formed by the top edges of the rectangles packed so far, and places each new
+    rectangle where its top edge ends up lowest. Unlike ShelfPacker, it doesn't need to know all the rectangles in
+    advance, and it wastes little space when rectangles have different sizes.
+    """
+
+    def __init__(self, width: int, height: int, padding: int = 1):
+        self.__width = width
+        self.__height = height
+        self.__padding = padding
+        # Each skyline segment is [x, y, width]
+        self.__skyline = [[0, 0, width]]
+
+
+    def insert(self, width: int, height: int) -> pygame.Rect:
+        """Returns the rectangle where a rectangle of the given size goes in the sheet, or None if it doesn't fit."""
+        padded_width = width + self.__padding
+        padded_height = height + self.__padding
+        best = None
+        for i, (x, _, _) in enumerate(self.__skyline):
+            y = self.__fit(i, padded_width)
+            if y is not None and y + padded_height <= self.__height + self.__padding:
+                if best is None or (y + padded_height, x) < (best[0], best[2]):
+                    best = (y + padded_height, i, x, y)
+        if best is None:
+            return None
+
+        top, i, x, y = best
+        self.__skyline.insert(i, [x, top, padded_width])
+        self.__trim(i)
+        self.__merge()
+        return pygame.Rect(x, y, width, height)
+
+
+    def __fit(self, i: int, width: int) -> int:
+        """Returns the y coordinate where a rectangle of the given width would rest at segment i, if it fits at all."""
+        x = self.__skyline[i][0]
+        if x + width > self.__width + self.__padding:
+            return None
+        y = 0
+        remaining = width
+        while remaining > 0 and i < len(self.__skyline):
+            y = max(y, self.__skyline[i][1])
+            remaining -= self.__skyline[i][2]
+            i += 1
+        return y
+
+
+    def __trim(self, i: int):
+        """Shrinks or removes the segments after segment i that the rectangle just placed on it covers."""
+        end = self.__skyline[i][0] + self.__skyline[i][2]
+        while i + 1 < len(self.__skyline):
+            segment = self.__skyline[i + 1]
+            if segment[0] >= end:
+                break
+            overlap = end - segment[0]
+            if overlap < segment[2]:
+                segment[0] += overlap
+                segment[2] -= overlap
+                break
+            del self.__skyline[i + 1]
+
+
+    def __merge(self):
+        """Merges neighbouring segments at the same height."""
+        i = 0
+        while i + 1 < len(self.__skyline):
+            if self.__skyline[i][1] == self.__skyline[i + 1][1]:
+                self.__skyline[i][2] += self.__skyline[i + 1][2]
+                del self.__skyline[i + 1]
+            else:
+                i += 1
@@ -1,20 +1,63 @@
+import math
+
 import numpy
 import pygame
 
 
+# Sines and cosines of every whole degree, since game object headings are whole degrees
+_sines = [math.sin(math.radians(degrees)) for degrees in range(360)]
+_cosines = [math.cos(math.radians(degrees)) for degrees in range(360)]
+
+
+def sin_cos(theta) -> tuple[float, float]:
+    """Returns the sine and cosine of theta degrees, looking them up in a table if theta is a whole number of degrees."""
+    if type(theta) is int:
+        degrees = theta % 360
+        return (_sines[degrees], _cosines[degrees])
+    rad = math.radians(theta)
+    return (math.sin(rad), math.cos(rad))
+
+
 class Transform():
-    """Class to manage 2d affine transformations."""
+    """
+    Class to manage 2d affine transformations: a uniform scale, followed by a rotation of -theta degrees (clockwise on
+    the screen, like game object headings), followed by a translation.
+
+    The transform is kept as the handful of floats that it's made of, so that applying it to a point only takes a few
+    float operations. apply_many applies it to a whole array of points at once.
+    """
+
+    __slots__ = ("__tx", "__ty", "__cos", "__sin")
 
     def __init__(self, translation=(0.0, 0.0), theta=0.0, scale=1.0):
-        t = self.translation_matrix(translation)
-        r = self.rotation_matrix(-theta)
-        s = self.scale_matrix(scale)
-        self.matrix = numpy.dot(numpy.dot(t, r), s)
+        sin, cos = sin_cos(theta)
+        self.__tx = float(translation[0])
+        self.__ty = float(translation[1])
+        self.__cos = cos * scale
+        self.__sin = sin * scale
 
     def apply(self, point):
         """Applies the transform to the given point."""
-        m = numpy.dot(self.matrix, numpy.array([point[0], point[1], 1.0]).transpose())
-        return pygame.Vector2(m[0], m[1])
+        x = point[0]
+        y = point[1]
+        return pygame.Vector2(self.__cos * x + self.__sin * y + self.__tx, self.__cos * y - self.__sin * x + self.__ty)
+
+    def apply_many(self, points) -> numpy.ndarray:
+        """Applies the transform to an array of points with one point per row, and returns the transformed points."""
+        points = numpy.asarray(points, dtype=float)
+        transformed = numpy.empty(points.shape)
+        transformed[:, 0] = self.__cos * points[:, 0] + self.__sin * points[:, 1] + self.__tx
+        transformed[:, 1] = self.__cos * points[:, 1] - self.__sin * points[:, 0] + self.__ty
+        return transformed
+
+    @property
+    def matrix(self) -> numpy.ndarray:
+        """The transform as a 3x3 matrix for homogeneous coordinates."""
+        return numpy.array([
+            [self.__cos, self.__sin, self.__tx],
+            [-self.__sin, self.__cos, self.__ty],
+            [0.0, 0.0, 1.0],
+        ])
 
     @classmethod
     def translation_matrix(cls, translation=(0.0, 0.0)):
@@ -25,9 +68,7 @@ class Transform():
 
     @classmethod
     def rotation_matrix(cls, theta):
-        rad = numpy.deg2rad(theta)
-        cos = numpy.cos(rad)
-        sin = numpy.sin(rad)
+        sin, cos = sin_cos(theta)
 
         m = numpy.identity(3)
         m[0][0] = cos
@@ -47,5 +88,8 @@ class Transform():
 
     @classmethod
     def rotate(cls, point, theta):
-        m = numpy.dot(cls.rotation_matrix(theta), numpy.array([point[0], point[1], 1.0]).transpose())
-        return pygame.Vector2(m[0], m[1])
+        """Rotates point by theta degrees (counterclockwise on the screen)."""
+        sin, cos = sin_cos(theta)
+        x = point[0]
+        y = point[1]
+        return pygame.Vector2(cos * x - sin * y, sin * x + cos * y)